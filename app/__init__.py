@@ -12,9 +12,9 @@ API routes with the core thermal physics model.
 
 
 
-from .thermal_service import run_thermal_analysis
+from .services.thermal_service import run_thermal_analysis, run_thermal_analysis_batch
 
 
 
-__all__ = ["run_thermal_analysis"]
+__all__ = ["run_thermal_analysis", "run_thermal_analysis_batch"]
 
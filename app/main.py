@@ -20,7 +20,9 @@ from flask import Flask, jsonify
 
 
 
-from routes import thermal_bp
+from json_provider import OrjsonProvider
+
+from .routes import thermal_bp
 
 
 
@@ -36,11 +38,7 @@ def create_app() -> Flask:
 
     app = Flask(__name__)
 
-
-
-    # Basic configuration
-
-    app.config["JSON_SORT_KEYS"] = False
+    app.json = OrjsonProvider(app)
 
 
 
@@ -76,6 +74,10 @@ def create_app() -> Flask:
 
 
 
+# Development server only; production runs under gunicorn
+
+# (see gunicorn.conf.py)
+
 if __name__ == "__main__":
 
     app = create_app()
@@ -86,7 +88,7 @@ if __name__ == "__main__":
 
     port = int(os.getenv("FLASK_PORT", 5000))
 
-    debug = os.getenv("FLASK_DEBUG", "true").lower() == "true"
+    debug = os.getenv("FLASK_DEBUG", "false").lower() == "true"
 
 
 
@@ -16,7 +16,15 @@ from flask import Blueprint, request, jsonify
 
 
 
-from .services.thermal_service import run_thermal_analysis
+from ..schemas import ThermalRequestSchema
+
+from ..services.thermal_service import (
+
+    run_thermal_analysis,
+
+    run_thermal_analysis_batch
+
+)
 
 
 
@@ -68,17 +76,65 @@ def solve_thermal():
 
 
 
-    payload = request.get_json()
-
+    try:
 
+        # Parse + validate the raw body in one pass (msgspec errors are ValueErrors)
 
-    try:
+        payload = ThermalRequestSchema.decode(request.get_data(cache=False))
 
         results = run_thermal_analysis(payload)
 
-    except KeyError as e:
+    except ValueError as e:
+
+        return jsonify({"error": str(e)}), 400
+
+    except Exception as e:
+
+        # Catch-all to avoid leaking stack traces
+
+        return jsonify({"error": "Internal server error"}), 500
+
+
+
+    return jsonify(results), 200
+
+
+
+
+
+@thermal_bp.route("/solve/batch", methods=["POST"])
+
+def solve_thermal_batch():
+
+    """
+
+    Solve thermal model for a list of inputs in one vectorized pass.
+
+
+
+    Expects a JSON array of payloads, each in the /solve format.
+
+
+
+    Returns:
+
+    - JSON array of /solve results, in request order
+
+    """
+
+
+
+    if not request.is_json:
+
+        return jsonify({"error": "Request must be JSON"}), 400
+
+
+
+    try:
+
+        payloads = ThermalRequestSchema.decode_many(request.get_data(cache=False))
 
-        return jsonify({"error": f"Missing required field: {e}"}), 400
+        results = run_thermal_analysis_batch(payloads)
 
     except ValueError as e:
 
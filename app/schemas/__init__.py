@@ -5,6 +5,7 @@ Request and response schema definitions for the API.
 from .io_models import *
 
 __all__ = [
+    "ThermalRequest",
     "ThermalRequestSchema",
     "ThermalResponseSchema"
 ]
@@ -6,7 +6,62 @@ and outgoing responses. They are intentionally lightweight and
 framework-agnostic.
 """
 
-from typing import Dict, Any
+from typing import Annotated, Dict, Any, List
+
+import msgspec
+
+from ..config import DEFAULT_THERMAL_CONDUCTIVITY_ALUMINUM
+
+
+# -----------------------------
+# Typed request (decoded + validated by msgspec in one C pass)
+# -----------------------------
+Positive = Annotated[float, msgspec.Meta(gt=0)]
+
+
+class ProcessorInput(msgspec.Struct):
+    die_length: Positive
+    die_width: Positive
+    power: Positive
+
+
+class HeatSinkInput(msgspec.Struct):
+    sink_length: Positive
+    sink_width: Positive
+    base_thickness: Positive
+    number_of_fins: Positive
+    fin_thickness: Positive
+    fin_height: Positive
+    thermal_conductivity: Positive = DEFAULT_THERMAL_CONDUCTIVITY_ALUMINUM
+
+
+class TIMInput(msgspec.Struct):
+    thermal_conductivity: Positive
+    thickness: Positive
+
+
+class AirInput(msgspec.Struct):
+    velocity: Positive
+    thermal_conductivity: Positive
+    kinematic_viscosity: Positive
+    prandtl_number: Positive
+
+
+class AmbientInput(msgspec.Struct):
+    temperature: float
+
+
+class ThermalRequest(msgspec.Struct):
+    processor: ProcessorInput
+    heat_sink: HeatSinkInput
+    tim: TIMInput
+    air: AirInput
+    ambient: AmbientInput
+    junction_to_case_resistance: Positive
+
+
+_REQUEST_DECODER = msgspec.json.Decoder(ThermalRequest)
+_BATCH_DECODER = msgspec.json.Decoder(List[ThermalRequest])
 
 
 class ThermalRequestSchema:
@@ -24,73 +79,40 @@ class ThermalRequestSchema:
     ]
 
     @staticmethod
-    def validate(payload: Dict[str, Any]) -> Dict[str, Any]:
+    def decode(body: bytes) -> ThermalRequest:
+        """
+        Parse and validate a raw JSON request body in a single pass.
+
+        Raises:
+            ValueError: if the body is malformed or invalid
+                (msgspec.DecodeError / msgspec.ValidationError)
+        """
+
+        return _REQUEST_DECODER.decode(body)
+
+    @staticmethod
+    def decode_many(body: bytes) -> List[ThermalRequest]:
+        """
+        Parse and validate a raw JSON array of requests in a single pass.
+
+        Raises:
+            ValueError: if the body is malformed or invalid
+        """
+
+        return _BATCH_DECODER.decode(body)
+
+    @staticmethod
+    def validate(payload: Dict[str, Any]) -> ThermalRequest:
         """
-        Validate incoming request payload.
+        Validate an already-parsed request payload against the same
+        typed schema used by decode.
 
         Raises:
-            KeyError: if required fields are missing
-            ValueError: if payload is invalid
+            ValueError: if the payload is missing fields or invalid
+                (msgspec.ValidationError)
         """
 
-        if not isinstance(payload, dict):
-            raise ValueError("Payload must be a JSON object")
-
-        # -----------------------------
-        # Required top-level fields
-        # -----------------------------
-        for field in ThermalRequestSchema.REQUIRED_FIELDS:
-            if field not in payload:
-                raise KeyError(field)
-
-        def require_number(value, name, allow_zero=False):
-            if not isinstance(value, (int, float)):
-                raise ValueError(f"{name} must be a number")
-            if not allow_zero and value <= 0:
-                raise ValueError(f"{name} must be > 0")
-
-        # -----------------------------
-        # Processor
-        # -----------------------------
-        processor = payload["processor"]
-        require_number(processor["die_length"], "processor.die_length")
-        require_number(processor["die_width"], "processor.die_width")
-        require_number(processor["power"], "processor.power", allow_zero=False)
-
-        # -----------------------------
-        # Heat sink
-        # -----------------------------
-        hs = payload["heat_sink"]
-        require_number(hs["sink_length"], "heat_sink.sink_length")
-        require_number(hs["sink_width"], "heat_sink.sink_width")
-        require_number(hs["base_thickness"], "heat_sink.base_thickness")
-        require_number(hs["number_of_fins"], "heat_sink.number_of_fins")
-        require_number(hs["fin_thickness"], "heat_sink.fin_thickness")
-        require_number(hs["fin_height"], "heat_sink.fin_height")
-
-        # -----------------------------
-        # TIM
-        # -----------------------------
-        tim = payload["tim"]
-        require_number(tim["thermal_conductivity"], "tim.thermal_conductivity")
-        require_number(tim["thickness"], "tim.thickness")
-
-        # -----------------------------
-        # Air
-        # -----------------------------
-        air = payload["air"]
-        require_number(air["velocity"], "air.velocity")
-        require_number(air["thermal_conductivity"], "air.thermal_conductivity")
-        require_number(air["kinematic_viscosity"], "air.kinematic_viscosity")
-        require_number(air["prandtl_number"], "air.prandtl_number")
-
-        # -----------------------------
-        # Ambient + Rjc
-        # -----------------------------
-        require_number(payload["ambient"]["temperature"], "ambient.temperature", allow_zero=True)
-        require_number(payload["junction_to_case_resistance"], "junction_to_case_resistance")
-
-        return payload
+        return msgspec.convert(payload, ThermalRequest)
 
 class ThermalValidationError(ValueError):
     pass
@@ -5,34 +5,42 @@ This module orchestrates the validated core thermal physics
 and prepares results for API responses.
 """
 
+from functools import lru_cache
+
+import numpy as np
+
+from core.batch import solve_thermal_network_batch
 from core.geometry import (
     compute_die_area,
     compute_fin_spacing,
     compute_total_convection_area
 )
-from core.tim import compute_tim_resistance
-from core.conduction import compute_conduction_resistance
-from core.convection import compute_convection_resistance
+from core.tim import _compute_tim_resistance_fast
+from core.conduction import _compute_conduction_resistance_fast
+from core.convection import _compute_convection_resistance_fast
 from core.resistance_network import (
     compute_heat_sink_resistance,
     compute_total_resistance
 )
 from core.solver import compute_junction_temperature
 
+from ..config import MAX_CACHE_SIZE
 from ..schemas import (
+    ThermalRequest,
     ThermalRequestSchema,
     ThermalResponseSchema
 )
 
 
-def run_thermal_analysis(payload: dict) -> dict:
+def run_thermal_analysis(payload: dict | ThermalRequest) -> dict:
     """
     Run full thermal analysis using the validated physics model.
 
     Parameters
     ----------
-    payload : dict
-        Input JSON payload from API request
+    payload : dict or ThermalRequest
+        Input JSON payload from API request, or a request already
+        decoded and validated by ThermalRequestSchema.decode
 
     Returns
     -------
@@ -41,64 +49,182 @@ def run_thermal_analysis(payload: dict) -> dict:
     """
 
     # -----------------------------
-    # Validate request structure
+    # Solve (memoized on the flat input tuple)
+    # -----------------------------
+    (
+        r_tim,
+        r_conduction,
+        r_convection,
+        r_heat_sink,
+        r_total,
+        junction_temperature
+    ) = _solve_thermal_network(*_solver_args(payload))
+
+    # -----------------------------
+    # Build response
     # -----------------------------
-    data = ThermalRequestSchema.validate(payload)
+    return ThermalResponseSchema.build(
+        r_tim=r_tim,
+        r_conduction=r_conduction,
+        r_convection=r_convection,
+        r_heat_sink=r_heat_sink,
+        r_total=r_total,
+        junction_temperature=junction_temperature
+    )
+
+
+def run_thermal_analysis_batch(payloads: list) -> list:
+    """
+    Run thermal analysis for a list of payloads in one vectorized pass.
+
+    Parameters
+    ----------
+    payloads : list
+        List of input payloads, each a dict in the single-request
+        format or a decoded ThermalRequest
+
+    Returns
+    -------
+    list
+        Structured thermal analysis results, one per payload
+    """
+
+    if not isinstance(payloads, list) or not payloads:
+        raise ValueError("Payload must be a non-empty JSON array")
+
+    # -----------------------------
+    # Validate and stack into SoA columns
+    # -----------------------------
+    rows = [_solver_args(payload) for payload in payloads]
+    columns = np.array(rows, dtype=np.float64).T
+
+    results = np.column_stack(solve_thermal_network_batch(*columns))
 
     # -----------------------------
-    # Extract inputs
+    # Build responses
     # -----------------------------
-    processor = data["processor"]
-    heat_sink = data["heat_sink"]
-    tim = data["tim"]
-    air = data["air"]
-    ambient = data["ambient"]
+    return [ThermalResponseSchema.build(*row) for row in results.tolist()]
+
+
+def _solver_args(payload: dict | ThermalRequest) -> tuple:
+    """
+    Validate a payload (unless already decoded) and flatten it.
+    """
+
+    if not isinstance(payload, ThermalRequest):
+        payload = ThermalRequestSchema.validate(payload)
+
+    return _flatten_request(payload)
+
+
+def _flatten_request(request: ThermalRequest) -> tuple:
+    """
+    Extract a decoded request in the fixed order used by the solvers.
+    """
+
+    processor = request.processor
+    heat_sink = request.heat_sink
+    tim = request.tim
+    air = request.air
+
+    return (
+        processor.die_length,
+        processor.die_width,
+        processor.power,
+        heat_sink.sink_length,
+        heat_sink.sink_width,
+        heat_sink.base_thickness,
+        heat_sink.number_of_fins,
+        heat_sink.fin_thickness,
+        heat_sink.fin_height,
+        heat_sink.thermal_conductivity,
+        tim.thermal_conductivity,
+        tim.thickness,
+        air.velocity,
+        air.thermal_conductivity,
+        air.kinematic_viscosity,
+        air.prandtl_number,
+        request.ambient.temperature,
+        request.junction_to_case_resistance
+    )
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _solve_thermal_network(
+    die_length: float,
+    die_width: float,
+    power: float,
+    sink_length: float,
+    sink_width: float,
+    base_thickness: float,
+    number_of_fins: int,
+    fin_thickness: float,
+    fin_height: float,
+    sink_thermal_conductivity: float,
+    tim_thermal_conductivity: float,
+    tim_thickness: float,
+    air_velocity: float,
+    air_thermal_conductivity: float,
+    kinematic_viscosity: float,
+    prandtl_number: float,
+    ambient_temperature: float,
+    junction_to_case_resistance: float
+) -> tuple:
+    """
+    Solve the resistance network for one set of validated inputs.
+
+    Inputs must already have passed ThermalRequestSchema.validate, so
+    the unchecked ``_fast`` core variants are used for the resistances.
+
+    Returns a flat tuple so cached results are immutable:
+    (r_tim, r_conduction, r_convection, r_heat_sink, r_total, T_j)
+    """
 
     # -----------------------------
     # Geometry calculations
     # -----------------------------
     die_area = compute_die_area(
-        processor["die_length"],
-        processor["die_width"]
+        die_length,
+        die_width
     )
 
     fin_spacing = compute_fin_spacing(
-        heat_sink["sink_width"],
-        heat_sink["number_of_fins"],
-        heat_sink["fin_thickness"]
+        sink_width,
+        number_of_fins,
+        fin_thickness
     )
 
     convection_area = compute_total_convection_area(
-        heat_sink["fin_height"],
-        heat_sink["sink_length"],
-        heat_sink["number_of_fins"]
+        fin_height,
+        sink_length,
+        number_of_fins
     )
 
     # -----------------------------
     # Individual resistances
     # -----------------------------
-    r_tim = compute_tim_resistance(
-        tim["thickness"],
-        tim["thermal_conductivity"],
+    r_tim = _compute_tim_resistance_fast(
+        tim_thickness,
+        tim_thermal_conductivity,
         die_area
     )
 
-    r_conduction = compute_conduction_resistance(
-        heat_sink["base_thickness"],
-        data["heat_sink"].get("thermal_conductivity", 167.0),
+    r_conduction = _compute_conduction_resistance_fast(
+        base_thickness,
+        sink_thermal_conductivity,
         die_area
     )
 
-    r_convection = compute_convection_resistance(
-        air_velocity=air["velocity"],
+    r_convection = _compute_convection_resistance_fast(
+        air_velocity=air_velocity,
         fin_spacing=fin_spacing,
-        fin_height=heat_sink["fin_height"],
+        fin_height=fin_height,
         total_convection_area=convection_area,
-        air_thermal_conductivity=air["thermal_conductivity"],
-        kinematic_viscosity=air["kinematic_viscosity"],
-        prandtl_number=air["prandtl_number"],
-        fin_thickness=heat_sink["fin_thickness"],
-        sink_thermal_conductivity=data["heat_sink"].get("thermal_conductivity", 167.0)
+        air_thermal_conductivity=air_thermal_conductivity,
+        kinematic_viscosity=kinematic_viscosity,
+        prandtl_number=prandtl_number,
+        fin_thickness=fin_thickness,
+        sink_thermal_conductivity=sink_thermal_conductivity
     )
 
     # -----------------------------
@@ -110,7 +236,7 @@ def run_thermal_analysis(payload: dict) -> dict:
     )
 
     r_total = compute_total_resistance(
-        data["junction_to_case_resistance"],
+        junction_to_case_resistance,
         r_tim,
         r_heat_sink
     )
@@ -119,19 +245,16 @@ def run_thermal_analysis(payload: dict) -> dict:
     # Final junction temperature
     # -----------------------------
     junction_temperature = compute_junction_temperature(
-        ambient_temperature=ambient["temperature"],
-        heat_dissipation=processor["power"],
+        ambient_temperature=ambient_temperature,
+        heat_dissipation=power,
         total_thermal_resistance=r_total
     )
 
-    # -----------------------------
-    # Build response
-    # -----------------------------
-    return ThermalResponseSchema.build(
-        r_tim=r_tim,
-        r_conduction=r_conduction,
-        r_convection=r_convection,
-        r_heat_sink=r_heat_sink,
-        r_total=r_total,
-        junction_temperature=junction_temperature
+    return (
+        r_tim,
+        r_conduction,
+        r_convection,
+        r_heat_sink,
+        r_total,
+        junction_temperature
     )
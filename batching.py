@@ -0,0 +1,124 @@
+"""
+Dynamic request batching for model inference.
+
+Concurrent callers submit single input rows; a background worker
+coalesces them into one (B, n_features) batch and runs a single
+forward pass, amortizing framework dispatch over the whole batch.
+
+Batching is opportunistic: the worker takes whatever is already queued
+and never sleeps on an empty queue, so a lone request is not delayed.
+Under load, rows pile up while the previous batch runs and are picked
+up together.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Sequence
+
+import numpy as np
+
+
+class BatchPredictor:
+    """
+    Queue-based dynamic batcher in front of a batch prediction function.
+
+    Parameters
+    ----------
+    predict_fn : callable
+        Maps a float32 array of shape (B, n_features) to B outputs.
+        The array is a view into a reused buffer and must not be kept.
+    n_features : int
+        Number of input features per row
+    batch_size : int
+        Maximum number of rows per forward pass
+    max_latency : float
+        Extra time (s) to wait for more rows once a batch already holds
+        rows from several callers. 0 (default) only takes rows that are
+        already queued; a single pending row is never held back.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], Sequence[float]],
+        n_features: int,
+        batch_size: int = 64,
+        max_latency: float = 0.0
+    ):
+        if batch_size < 1:
+            raise ValueError("Batch size must be >= 1")
+        if max_latency < 0:
+            raise ValueError("Max latency cannot be negative")
+
+        self.predict_fn = predict_fn
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+
+        self._buffer = np.empty((batch_size, n_features), dtype=np.float32)
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def predict(self, row: Sequence[float]) -> float:
+        """
+        Submit a single input row and block until its output is ready.
+        """
+        self._ensure_worker()
+
+        future = Future()
+        self._queue.put((row, future))
+        return future.result()
+
+    def _ensure_worker(self):
+        # Started lazily so forked server workers each get their own thread
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="batch-predictor", daemon=True
+                )
+                self._worker.start()
+
+    def _collect(self) -> list:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_latency
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except queue.Empty:
+                pass
+
+            # Queue drained. Only wait for stragglers when there is
+            # concurrent traffic; a lone row is served immediately.
+            timeout = deadline - time.monotonic()
+            if len(batch) < 2 or timeout <= 0:
+                break
+
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            n = len(batch)
+
+            try:
+                for i, (row, _) in enumerate(batch):
+                    self._buffer[i] = row
+                outputs = self.predict_fn(self._buffer[:n])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), output in zip(batch, outputs):
+                future.set_result(output)
@@ -17,3 +17,4 @@ from .conduction import compute_conduction_resistance
 from .convection import compute_convection_resistance
 from .resistance_network import compute_total_resistance
 from .solver import compute_junction_temperature
+from .batch import compute_nusselt_number_batch, solve_thermal_network_batch
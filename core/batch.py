@@ -0,0 +1,152 @@
+"""
+Vectorized thermal resistance network for batches of inputs.
+
+Evaluates the same geometry → resistance → junction temperature
+pipeline as the scalar modules, but on structure-of-arrays NumPy
+columns so that N requests are solved with one set of array
+operations instead of N chains of Python function calls.
+"""
+
+import numpy as np
+
+
+def _require_positive(name: str, values: np.ndarray):
+    if np.any(values <= 0):
+        raise ValueError(f"{name} must be positive")
+
+
+def compute_nusselt_number_batch(
+    reynolds_number: np.ndarray,
+    prandtl_number: np.ndarray,
+    fin_spacing: np.ndarray,
+    fin_height: np.ndarray
+) -> np.ndarray:
+    """
+    Branch-free Nusselt number for arrays of inputs.
+
+    Both correlations are evaluated for every element and blended
+    with np.where, so sweeps that cross the laminar/turbulent
+    transition run without per-element branching.
+
+    - Laminar (Re < 2300): Sieder-Tate correlation
+    - Turbulent (Re >= 2300): Dittus-Boelter correlation
+    """
+
+    nu_laminar = 1.86 * np.cbrt(
+        reynolds_number * prandtl_number * (2 * fin_spacing / fin_height)
+    )
+    nu_turbulent = 0.023 * reynolds_number ** 0.8 * prandtl_number ** 0.3
+
+    return np.where(reynolds_number < 2300, nu_laminar, nu_turbulent)
+
+
+def solve_thermal_network_batch(
+    die_length: np.ndarray,
+    die_width: np.ndarray,
+    power: np.ndarray,
+    sink_length: np.ndarray,
+    sink_width: np.ndarray,
+    base_thickness: np.ndarray,
+    number_of_fins: np.ndarray,
+    fin_thickness: np.ndarray,
+    fin_height: np.ndarray,
+    sink_thermal_conductivity: np.ndarray,
+    tim_thermal_conductivity: np.ndarray,
+    tim_thickness: np.ndarray,
+    air_velocity: np.ndarray,
+    air_thermal_conductivity: np.ndarray,
+    kinematic_viscosity: np.ndarray,
+    prandtl_number: np.ndarray,
+    ambient_temperature: np.ndarray,
+    junction_to_case_resistance: np.ndarray
+) -> tuple:
+    """
+    Solve the junction-to-ambient resistance network for N inputs.
+
+    All arguments are 1D arrays of equal length N (one entry per
+    request), in the same units as the scalar core functions.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (r_tim, r_conduction, r_convection, r_heat_sink, r_total, T_j),
+        each of shape (N,)
+    """
+
+    # -----------------------------
+    # Input checks
+    # -----------------------------
+    _require_positive("Die length", die_length)
+    _require_positive("Die width", die_width)
+    _require_positive("Sink length", sink_length)
+    _require_positive("Sink width", sink_width)
+    _require_positive("Base thickness", base_thickness)
+    _require_positive("Fin thickness", fin_thickness)
+    _require_positive("Fin height", fin_height)
+    _require_positive("Thermal conductivity", sink_thermal_conductivity)
+    _require_positive("TIM thermal conductivity", tim_thermal_conductivity)
+    _require_positive("TIM thickness", tim_thickness)
+    _require_positive("Air velocity", air_velocity)
+    _require_positive("Air thermal conductivity", air_thermal_conductivity)
+    _require_positive("Kinematic viscosity", kinematic_viscosity)
+    _require_positive("Prandtl number", prandtl_number)
+
+    if np.any(number_of_fins <= 1):
+        raise ValueError("Number of fins must be greater than 1")
+    if np.any(power < 0):
+        raise ValueError("Heat dissipation cannot be negative")
+    if np.any(junction_to_case_resistance < 0):
+        raise ValueError("Junction-to-case resistance cannot be negative")
+
+    # -----------------------------
+    # Geometry
+    # -----------------------------
+    die_area = die_length * die_width
+
+    usable_width = sink_width - number_of_fins * fin_thickness
+    if np.any(usable_width <= 0):
+        raise ValueError("Invalid fin geometry: fins occupy entire sink width")
+
+    fin_spacing = usable_width / (number_of_fins - 1)
+    convection_area = 2.0 * number_of_fins * fin_height * sink_length
+
+    # -----------------------------
+    # TIM and base conduction
+    # -----------------------------
+    r_tim = tim_thickness / (tim_thermal_conductivity * die_area)
+    r_conduction = base_thickness / (sink_thermal_conductivity * die_area)
+
+    # -----------------------------
+    # Forced convection
+    # -----------------------------
+    reynolds = air_velocity * fin_spacing / kinematic_viscosity
+
+    nusselt = compute_nusselt_number_batch(
+        reynolds,
+        prandtl_number,
+        fin_spacing,
+        fin_height
+    )
+
+    h = nusselt * air_thermal_conductivity / (2 * fin_spacing)
+
+    m_l = np.sqrt(2.0 * h / (sink_thermal_conductivity * fin_thickness)) * fin_height
+    fin_efficiency = np.where(m_l > 10, 1.0, np.tanh(m_l)) / m_l
+
+    r_convection = 1.0 / (h * convection_area * fin_efficiency)
+
+    # -----------------------------
+    # Network and junction temperature
+    # -----------------------------
+    r_heat_sink = r_conduction + r_convection
+    r_total = junction_to_case_resistance + r_tim + r_heat_sink
+    junction_temperature = ambient_temperature + power * r_total
+
+    return (
+        r_tim,
+        r_conduction,
+        r_convection,
+        r_heat_sink,
+        r_total,
+        junction_temperature
+    )
@@ -35,4 +35,21 @@ def compute_conduction_resistance(
     if die_area <= 0:
         raise ValueError("Die area must be positive")
 
+    return _compute_conduction_resistance_fast(
+        base_thickness,
+        thermal_conductivity,
+        die_area
+    )
+
+
+def _compute_conduction_resistance_fast(
+    base_thickness: float,
+    thermal_conductivity: float,
+    die_area: float
+) -> float:
+    """
+    Unchecked variant of compute_conduction_resistance for validated inputs.
+    """
+
     return base_thickness / (thermal_conductivity * die_area)
+
@@ -5,7 +5,12 @@ Implements channel flow convection between parallel plates
 as defined in the Thermal Reference document.
 """
 
-import math
+from ._kernels import (
+    _nusselt as _compute_nusselt_number_fast,
+    _fin_eta as _compute_fin_efficiency_fast,
+    _r_conv as _compute_convection_resistance_fast
+)
+
 
 def compute_reynolds_number(
     air_velocity: float,
@@ -24,6 +29,22 @@ def compute_reynolds_number(
     if kinematic_viscosity <= 0:
         raise ValueError("Kinematic viscosity must be positive")
 
+    return _compute_reynolds_number_fast(
+        air_velocity,
+        characteristic_length,
+        kinematic_viscosity
+    )
+
+
+def _compute_reynolds_number_fast(
+    air_velocity: float,
+    characteristic_length: float,
+    kinematic_viscosity: float
+) -> float:
+    """
+    Unchecked variant of compute_reynolds_number for validated inputs.
+    """
+
     return air_velocity * characteristic_length / kinematic_viscosity
 
 
@@ -49,16 +70,12 @@ def compute_nusselt_number(
     if fin_height <= 0:
         raise ValueError("Fin height must be positive")
 
-    # Laminar flow
-    if reynolds_number < 2300:
-        return 1.86 * (
-            reynolds_number
-            * prandtl_number
-            * (2 * fin_spacing / fin_height)
-        ) ** (1.0 / 3.0)
-
-    # Turbulent flow
-    return 0.023 * (reynolds_number ** 0.8) * (prandtl_number ** 0.3)
+    return _compute_nusselt_number_fast(
+        reynolds_number,
+        prandtl_number,
+        fin_spacing,
+        fin_height
+    )
 
 
 def compute_heat_transfer_coefficient(
@@ -79,6 +96,22 @@ def compute_heat_transfer_coefficient(
     if fin_spacing <= 0:
         raise ValueError("Fin spacing must be positive")
 
+    return _compute_heat_transfer_coefficient_fast(
+        nusselt_number,
+        air_thermal_conductivity,
+        fin_spacing
+    )
+
+
+def _compute_heat_transfer_coefficient_fast(
+    nusselt_number: float,
+    air_thermal_conductivity: float,
+    fin_spacing: float
+) -> float:
+    """
+    Unchecked variant of compute_heat_transfer_coefficient for validated inputs.
+    """
+
     return nusselt_number * air_thermal_conductivity / (2 * fin_spacing)
 
 
@@ -103,14 +136,13 @@ def compute_fin_efficiency(
         raise ValueError("Fin thickness must be positive")
     if thermal_conductivity <= 0:
         raise ValueError("Thermal conductivity must be positive")
-    
-    m = (2.0 * heat_transfer_coefficient / (thermal_conductivity * fin_thickness)) ** 0.5
-    m_l = m * fin_height
-    
-    if m_l > 10:  # Prevent overflow for very long fins
-        return 1.0 / (m_l)
-    
-    return math.tanh(m_l) / m_l
+
+    return _compute_fin_efficiency_fast(
+        fin_height,
+        heat_transfer_coefficient,
+        fin_thickness,
+        thermal_conductivity
+    )
 
 
 def compute_convection_resistance(
@@ -132,31 +164,31 @@ def compute_convection_resistance(
 
     if total_convection_area <= 0:
         raise ValueError("Total convection area must be positive")
+    if air_velocity <= 0:
+        raise ValueError("Air velocity must be positive")
+    if fin_spacing <= 0:
+        raise ValueError("Fin spacing must be positive")
+    if fin_height <= 0:
+        raise ValueError("Fin height must be positive")
+    if air_thermal_conductivity <= 0:
+        raise ValueError("Air thermal conductivity must be positive")
+    if kinematic_viscosity <= 0:
+        raise ValueError("Kinematic viscosity must be positive")
+    if prandtl_number <= 0:
+        raise ValueError("Prandtl number must be positive")
+    if fin_thickness <= 0:
+        raise ValueError("Fin thickness must be positive")
+    if sink_thermal_conductivity <= 0:
+        raise ValueError("Thermal conductivity must be positive")
 
-    reynolds_number = compute_reynolds_number(
+    return _compute_convection_resistance_fast(
         air_velocity=air_velocity,
-        characteristic_length=fin_spacing,
-        kinematic_viscosity=kinematic_viscosity
-    )
-
-    nusselt_number = compute_nusselt_number(
-        reynolds_number=reynolds_number,
-        prandtl_number=prandtl_number,
         fin_spacing=fin_spacing,
-        fin_height=fin_height
-    )
-
-    h = compute_heat_transfer_coefficient(
-        nusselt_number=nusselt_number,
-        air_thermal_conductivity=air_thermal_conductivity,
-        fin_spacing=fin_spacing
-    )
-
-    fin_efficiency = compute_fin_efficiency(
         fin_height=fin_height,
-        heat_transfer_coefficient=h,
+        total_convection_area=total_convection_area,
+        air_thermal_conductivity=air_thermal_conductivity,
+        kinematic_viscosity=kinematic_viscosity,
+        prandtl_number=prandtl_number,
         fin_thickness=fin_thickness,
-        thermal_conductivity=sink_thermal_conductivity
+        sink_thermal_conductivity=sink_thermal_conductivity
     )
-
-    return 1.0 / (h * total_convection_area * fin_efficiency)
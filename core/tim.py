@@ -37,4 +37,21 @@ def compute_tim_resistance(
     if die_area <= 0:
         raise ValueError("Die area must be positive")
 
+    return _compute_tim_resistance_fast(
+        tim_thickness,
+        tim_thermal_conductivity,
+        die_area
+    )
+
+
+def _compute_tim_resistance_fast(
+    tim_thickness: float,
+    tim_thermal_conductivity: float,
+    die_area: float
+) -> float:
+    """
+    Unchecked variant of compute_tim_resistance for validated inputs.
+    """
+
     return tim_thickness / (tim_thermal_conductivity * die_area)
+
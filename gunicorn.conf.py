@@ -0,0 +1,47 @@
+"""
+Gunicorn configuration for production deployments.
+
+Loaded automatically when gunicorn is started from the project root:
+
+    gunicorn "app.main:create_app()"
+
+All values can be overridden through environment variables
+(see .env.example).
+"""
+
+import os
+
+# -----------------------------
+# Binding
+# -----------------------------
+bind = "{}:{}".format(
+    os.getenv("FLASK_HOST", "0.0.0.0"),
+    os.getenv("PORT", os.getenv("FLASK_PORT", "5000"))
+)
+
+# -----------------------------
+# Workers
+# -----------------------------
+# One process per usable core for the CPU-bound solves, a few threads
+# each to overlap request I/O. The default is capped at 4: every worker
+# holds its own copy of the solver stack, and cpu_count() reports the
+# host's cores inside containers, not the container's memory budget.
+if hasattr(os, "sched_getaffinity"):
+    _usable_cpus = len(os.sched_getaffinity(0))
+else:
+    _usable_cpus = os.cpu_count() or 1
+
+workers = int(os.getenv("WORKERS", min(_usable_cpus, 4)))
+worker_class = os.getenv("WORKER_CLASS", "gthread")
+threads = int(os.getenv("THREADS", 4))
+
+# Import the app (and compile/load everything) once in the master;
+# forked workers share those pages copy-on-write.
+preload_app = True
+
+# -----------------------------
+# Worker lifecycle
+# -----------------------------
+timeout = int(os.getenv("TIMEOUT", 30))
+max_requests = int(os.getenv("MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", 100))
@@ -0,0 +1,45 @@
+"""
+orjson-backed JSON provider shared by both Flask applications.
+
+Replaces Flask's stdlib ``json`` provider so that ``jsonify`` and
+``request.get_json`` go through orjson. NumPy scalars and arrays are
+serialized natively, without a Python-level conversion.
+
+Kept at the top level, outside the app package: importing it from
+app.py must not pull in the thermal solver stack via app/__init__.py.
+"""
+
+from typing import Any
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider using orjson for encoding and decoding.
+    """
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    # Mirror DefaultJSONProvider: insertion-ordered keys, no indentation
+    sort_keys = False
+    compact = True
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize ``obj`` to a JSON string.
+        """
+        option = self.option
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if not self.compact:
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(obj, option=option).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Deserialize a JSON string or bytes to a Python object.
+        """
+        return orjson.loads(s)
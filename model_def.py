@@ -1,3 +1,7 @@
+import copy
+import inspect
+
+import numpy as np
 import torch
 import torch.nn as nn
 
@@ -10,6 +14,19 @@ class PINN(nn.Module):
         self.fin_height_scale = 0.04
         self.velocity_scale = 3.0
 
+        # (1, 3) reciprocal scales: normalization is a single broadcast
+        # multiply. Not persistent, so existing checkpoints still load.
+        self.register_buffer(
+            "_inv_scales",
+            1.0 / torch.tensor(
+                [[self.power_scale, self.fin_height_scale, self.velocity_scale]]
+            ),
+            persistent=False
+        )
+
+        # Set by fold_input_scaling(); forward() then skips normalization
+        self.scaling_folded = False
+
         self.net = nn.Sequential(
             nn.Linear(3, 64),
             nn.Tanh(),
@@ -18,11 +35,95 @@ class PINN(nn.Module):
             nn.Linear(64, 1)
         )
 
+    def fold_input_scaling(self):
+        """
+        Absorb the fixed input scaling into the first Linear layer.
+
+        Call after load_state_dict(); the folded weights must not be
+        saved back as a regular checkpoint.
+        """
+        if self.scaling_folded:
+            return self
+
+        scales = torch.tensor(
+            [self.power_scale, self.fin_height_scale, self.velocity_scale]
+        )
+        with torch.no_grad():
+            self.net[0].weight.div_(scales)
+
+        self.scaling_folded = True
+        return self
+
     def forward(self, x):
-        x_norm = torch.stack([
-            x[:, 0] / self.power_scale,
-            x[:, 1] / self.fin_height_scale,
-            x[:, 2] / self.velocity_scale
-        ], dim=1)
+        if self.scaling_folded:
+            return self.net(x)
+
+        return self.net(x * self._inv_scales)
+
+
+class NumpyPINN:
+    """
+    NumPy forward pass of a loaded PINN, bypassing the torch runtime.
+
+    Weights are copied once into contiguous float32 arrays with the
+    input scaling folded into the first layer.
+    """
+
+    def __init__(self, model: PINN):
+        weights = [
+            model.net[i].weight.detach().cpu().numpy().astype(np.float32)
+            for i in (0, 2, 4)
+        ]
+        biases = [
+            model.net[i].bias.detach().cpu().numpy().astype(np.float32)
+            for i in (0, 2, 4)
+        ]
+
+        if not model.scaling_folded:
+            weights[0] = weights[0] / np.array(
+                [model.power_scale, model.fin_height_scale, model.velocity_scale],
+                dtype=np.float32
+            )
+
+        # Stored transposed so batches of row vectors multiply on the left
+        self.w1, self.w2, self.w3 = (np.ascontiguousarray(w.T) for w in weights)
+        self.b1, self.b2, self.b3 = biases
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        h = x @ self.w1
+        h += self.b1
+        np.tanh(h, out=h)
+
+        h = h @ self.w2
+        h += self.b2
+        np.maximum(h, 0.0, out=h)
+
+        return h @ self.w3 + self.b3
+
+
+def export_onnx(model: PINN, path: str):
+    """
+    Export a loaded PINN to ONNX with its input scaling folded in.
+
+    One-time step for the ONNX Runtime backend (PINN_BACKEND=onnx);
+    the input is named "input" with a dynamic batch dimension.
+    """
+    folded = copy.deepcopy(model).eval().fold_input_scaling()
+
+    # torch >= 2.5 accepts dynamo=...; force the TorchScript exporter
+    # there, older releases use it unconditionally
+    extra = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        extra["dynamo"] = False
 
-        return self.net(x_norm)
+    torch.onnx.export(
+        folded,
+        torch.zeros(1, 3),
+        path,
+        input_names=["input"],
+        output_names=["temperature_rise"],
+        dynamic_axes={"input": {0: "batch"}, "temperature_rise": {0: "batch"}},
+        opset_version=17,
+        do_constant_folding=True,
+        **extra
+    )
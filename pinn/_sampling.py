@@ -0,0 +1,59 @@
+"""
+Point sampling kernels for the heat sink domain.
+
+Numba-compiled loops that draw from the domain's NumPy Generator point
+by point and write straight into the float32 output, so a given seed
+always yields the same points. Inputs are assumed to be validated by
+the caller.
+
+The loops are serial: a Generator cannot be shared across prange
+threads, and per-thread generators would make seeded runs depend on
+the thread count.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def sample_box(rng, n_points, low, span):
+    points = np.empty((n_points, 3), dtype=np.float32)
+
+    for i in range(n_points):
+        for j in range(3):
+            points[i, j] = low[j] + span[j] * rng.random(dtype=np.float32)
+
+    return points
+
+
+@njit(cache=True)
+def sample_plane(rng, n_points, low, span, z):
+    points = np.empty((n_points, 3), dtype=np.float32)
+
+    for i in range(n_points):
+        points[i, 0] = low[0] + span[0] * rng.random(dtype=np.float32)
+        points[i, 1] = low[1] + span[1] * rng.random(dtype=np.float32)
+        points[i, 2] = z
+
+    return points
+
+
+@njit(cache=True)
+def sample_side_walls(rng, n_points, low, span):
+    points = np.empty((n_points, 3), dtype=np.float32)
+
+    for i in range(n_points):
+        # 0 -> x_min, 1 -> x_max, 2 -> y_min, 3 -> y_max
+        face = int(rng.random() * 4.0)
+        u = rng.random(dtype=np.float32)
+
+        if face < 2:
+            points[i, 0] = low[0] + span[0] * face
+            points[i, 1] = low[1] + span[1] * u
+        else:
+            points[i, 0] = low[0] + span[0] * u
+            points[i, 1] = low[1] + span[1] * (face - 2)
+
+        points[i, 2] = low[2] + span[2] * rng.random(dtype=np.float32)
+
+    return points
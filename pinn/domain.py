@@ -6,6 +6,9 @@ to sample interior and boundary points for physics-based learning.
 """
 
 import numpy as np
+import torch
+
+from pinn import _sampling
 
 
 class HeatSinkDomain:
@@ -23,7 +26,8 @@ class HeatSinkDomain:
         sink_length: float,
         sink_width: float,
         fin_height: float,
-        base_thickness: float
+        base_thickness: float,
+        seed: int | None = None
     ):
         if sink_length <= 0:
             raise ValueError("Sink length must be positive")
@@ -45,74 +49,173 @@ class HeatSinkDomain:
 
         self.base_z = base_thickness
 
+        # PCG64 generator owned by the domain; pass a seed for
+        # reproducible point sets
+        seed_sequence = np.random.SeedSequence(seed)
+        self._rng = np.random.default_rng(seed_sequence)
+
+        # Seed for the per-device torch generators, derived from the
+        # same entropy so the torch samplers honour `seed` as well
+        self._torch_seed = int(seed_sequence.generate_state(1, np.uint64)[0])
+
+        # Lower corner and extent of the box; the samplers map unit
+        # uniforms u to coordinates as low + span * u
+        self._low = np.array(
+            [self.x_min, self.y_min, self.z_min], dtype=np.float32
+        )
+        self._span = np.array(
+            [
+                self.x_max - self.x_min,
+                self.y_max - self.y_min,
+                self.z_max - self.z_min
+            ],
+            dtype=np.float32
+        )
+
+        # (low, span) bound tensors and torch.Generator per device for
+        # the torch samplers
+        self._torch_bounds = {}
+        self._torch_generators = {}
+
     def sample_interior(self, n_points: int) -> np.ndarray:
         """
         Sample interior points inside the heat sink volume.
 
         Returns:
-            Array of shape (n_points, 3) → (x, y, z)
+            float32 array of shape (n_points, 3) → (x, y, z)
         """
 
         if n_points <= 0:
             raise ValueError("Number of points must be positive")
 
-        x = np.random.uniform(self.x_min, self.x_max, n_points)
-        y = np.random.uniform(self.y_min, self.y_max, n_points)
-        z = np.random.uniform(self.z_min, self.z_max, n_points)
-
-        return np.column_stack((x, y, z))
+        return _sampling.sample_box(self._rng, n_points, self._low, self._span)
 
     # Boundary sampling
 
     def sample_base(self, n_points: int) -> np.ndarray:
         """
         Sample points on the die–base interface (heat flux boundary).
+
+        Returns:
+            float32 array of shape (n_points, 3) → (x, y, z)
         """
 
         if n_points <= 0:
             raise ValueError("Number of points must be positive")
 
-        x = np.random.uniform(self.x_min, self.x_max, n_points)
-        y = np.random.uniform(self.y_min, self.y_max, n_points)
-        z = np.full(n_points, self.base_z)
-
-        return np.column_stack((x, y, z))
+        return _sampling.sample_plane(
+            self._rng, n_points, self._low, self._span, self.base_z
+        )
 
     def sample_top(self, n_points: int) -> np.ndarray:
         """
         Sample points on the top fin surface (convective boundary).
+
+        Returns:
+            float32 array of shape (n_points, 3) → (x, y, z)
         """
 
         if n_points <= 0:
             raise ValueError("Number of points must be positive")
 
-        x = np.random.uniform(self.x_min, self.x_max, n_points)
-        y = np.random.uniform(self.y_min, self.y_max, n_points)
-        z = np.full(n_points, self.z_max)
-
-        return np.column_stack((x, y, z))
+        return _sampling.sample_plane(
+            self._rng, n_points, self._low, self._span, self.z_max
+        )
 
     def sample_side_walls(self, n_points: int) -> np.ndarray:
         """
         Sample points on the side walls (assumed convective or symmetry BC).
+
+        Returns:
+            float32 array of shape (n_points, 3) → (x, y, z)
         """
 
         if n_points <= 0:
             raise ValueError("Number of points must be positive")
 
-        points = []
+        return _sampling.sample_side_walls(
+            self._rng, n_points, self._low, self._span
+        )
+
+    # Device-side sampling
+
+    def sample_interior_torch(self, n_points: int, device="cpu") -> torch.Tensor:
+        """
+        Sample interior points directly as a float32 tensor on `device`.
+
+        Avoids the NumPy round trip and host-to-device copy when
+        training on a GPU.
+        """
+
+        if n_points <= 0:
+            raise ValueError("Number of points must be positive")
+
+        low, span = self._bounds_on(device)
+
+        points = torch.rand(
+            n_points, 3, device=device, generator=self._generator_on(device)
+        )
+        return points.mul_(span).add_(low)
+
+    def sample_base_torch(self, n_points: int, device="cpu") -> torch.Tensor:
+        """
+        Tensor counterpart of sample_base().
+        """
+
+        return self._sample_plane_torch(n_points, self.base_z, device)
+
+    def sample_top_torch(self, n_points: int, device="cpu") -> torch.Tensor:
+        """
+        Tensor counterpart of sample_top().
+        """
+
+        return self._sample_plane_torch(n_points, self.z_max, device)
+
+    def _sample_plane_torch(self, n_points: int, z: float, device) -> torch.Tensor:
+        if n_points <= 0:
+            raise ValueError("Number of points must be positive")
+
+        points = torch.rand(
+            n_points, 3, device=device, generator=self._generator_on(device)
+        )
+        points[:, 0].mul_(self.x_max - self.x_min).add_(self.x_min)
+        points[:, 1].mul_(self.y_max - self.y_min).add_(self.y_min)
+        points[:, 2].fill_(z)
+
+        return points
+
+    def _bounds_on(self, device) -> tuple:
+        """
+        Domain lower corner and extent as tensors on `device`.
+
+        Built once per device so that sampling every epoch does not
+        allocate and upload them again.
+        """
+
+        device = torch.device(device)
+
+        if device not in self._torch_bounds:
+            self._torch_bounds[device] = (
+                torch.from_numpy(self._low).to(device),
+                torch.from_numpy(self._span).to(device)
+            )
+
+        return self._torch_bounds[device]
+
+    def _generator_on(self, device) -> torch.Generator:
+        """
+        The domain's torch.Generator on `device`.
+
+        Each device gets its own generator seeded from the domain seed,
+        so seeded domains give reproducible tensor samples without
+        touching torch's global RNG. Streams differ between devices.
+        """
 
-        for _ in range(n_points):
-            face = np.random.choice(["x0", "x1", "y0", "y1"])
-            z = np.random.uniform(self.z_min, self.z_max)
+        device = torch.device(device)
 
-            if face == "x0":
-                points.append([self.x_min, np.random.uniform(self.y_min, self.y_max), z])
-            elif face == "x1":
-                points.append([self.x_max, np.random.uniform(self.y_min, self.y_max), z])
-            elif face == "y0":
-                points.append([np.random.uniform(self.x_min, self.x_max), self.y_min, z])
-            else:
-                points.append([np.random.uniform(self.x_min, self.x_max), self.y_max, z])
+        if device not in self._torch_generators:
+            generator = torch.Generator(device)
+            generator.manual_seed(self._torch_seed)
+            self._torch_generators[device] = generator
 
-        return np.array(points)
+        return self._torch_generators[device]
@@ -9,6 +9,46 @@ import torch
 import numpy as np
 
 
+def points_to_tensor(
+    points: np.ndarray,
+    device: str = "cpu"
+) -> torch.Tensor:
+    """
+    Convert an (N, 3) point array into a float32 model input on `device`.
+
+    On CPU the tensor shares memory with the array whenever it is
+    already contiguous float32. For CUDA the batch is staged in pinned
+    memory so the upload runs asynchronously.
+    """
+
+    inputs = torch.from_numpy(np.ascontiguousarray(points, dtype=np.float32))
+
+    if torch.device(device).type == "cuda":
+        inputs = inputs.pin_memory().to(device, non_blocking=True)
+
+    return inputs
+
+
+def to_device_once(
+    model: torch.nn.Module,
+    device: str = "cpu"
+) -> torch.nn.Module:
+    """
+    Move a model to `device` unless its parameters are already there.
+
+    Call once before a series of predictions; predict_temperature()
+    itself does not move the model.
+    """
+
+    target = torch.device(device)
+    parameter = next(model.parameters(), None)
+
+    if parameter is not None and parameter.device != target:
+        model.to(target)
+
+    return model
+
+
 def predict_temperature(
     model: torch.nn.Module,
     points: np.ndarray,
@@ -20,7 +60,7 @@ def predict_temperature(
     Parameters
     ----------
     model : torch.nn.Module
-        Trained PINN model
+        Trained PINN model, already on `device` (see to_device_once)
     points : np.ndarray
         Array of shape (N, 3) containing (x, y, z) coordinates
     device : str
@@ -36,13 +76,12 @@ def predict_temperature(
         raise ValueError("Points array must have shape (N, 3)")
 
     model.eval()
-    model.to(device)
 
     with torch.no_grad():
-        inputs = torch.tensor(points, dtype=torch.float32, device=device)
+        inputs = points_to_tensor(points, device)
         temperatures = model(inputs)
 
-    return temperatures.cpu().numpy().flatten()
+    return temperatures.cpu().numpy()
 
 
 def predict_temperature_field(
@@ -59,7 +98,7 @@ def predict_temperature_field(
     Parameters
     ----------
     model : torch.nn.Module
-        Trained PINN model
+        Trained PINN model, already on `device`
     domain : HeatSinkDomain
         Spatial domain object
     n_points : int
@@ -8,6 +8,15 @@ Implements:
 """
 
 import torch
+from torch.func import grad, grad_and_value, jacrev, vmap
+
+
+def _at_least_fp32(tensor: torch.Tensor) -> torch.Tensor:
+    """
+    Upcast reduced-precision (BF16/FP16) tensors to FP32; leave FP32
+    and FP64 unchanged.
+    """
+    return tensor.to(torch.promote_types(tensor.dtype, torch.float32))
 
 
 # PDE: Steady-state heat equation
@@ -36,43 +45,53 @@ def pde_residual_loss(
         Mean squared PDE residual
     """
 
-    points.requires_grad_(True)
-    temperature = model(points)
+    # Per-point 3x3 Hessian as the Jacobian of the gradient (one
+    # reverse-over-reverse sweep, vectorized over the batch); the
+    # Laplacian is its trace
+    def temperature_at(point):
+        return model(point.unsqueeze(0))[0]
 
-    grads = torch.autograd.grad(
-        outputs=temperature,
-        inputs=points,
-        grad_outputs=torch.ones_like(temperature),
-        create_graph=True
-    )[0]
+    hessians = vmap(jacrev(grad(temperature_at)))(points)
+    # Reduce in at least FP32 even when the network runs under BF16
+    # autocast; FP32/FP64 results keep their precision
+    laplacian = _at_least_fp32(torch.einsum("nii->n", hessians))
 
-    dT_dx = grads[:, 0]
-    dT_dy = grads[:, 1]
-    dT_dz = grads[:, 2]
+    residual = thermal_conductivity * laplacian
+    return torch.mean(residual ** 2)
 
-    d2T_dx2 = torch.autograd.grad(
-        dT_dx, points, grad_outputs=torch.ones_like(dT_dx), create_graph=True
-    )[0][:, 0]
 
-    d2T_dy2 = torch.autograd.grad(
-        dT_dy, points, grad_outputs=torch.ones_like(dT_dy), create_graph=True
-    )[0][:, 1]
+# Boundary temperatures and gradients
 
-    d2T_dz2 = torch.autograd.grad(
-        dT_dz, points, grad_outputs=torch.ones_like(dT_dz), create_graph=True
-    )[0][:, 2]
+def temperature_and_gradient(
+    model: torch.nn.Module,
+    points: torch.Tensor
+) -> tuple:
+    """
+    Temperature and its spatial gradient at each point.
 
-    laplacian = d2T_dx2 + d2T_dy2 + d2T_dz2
+    One batched forward/backward pass serves every boundary loss, so
+    base and surface points can be evaluated together.
 
-    residual = thermal_conductivity * laplacian
-    return torch.mean(residual ** 2)
+    Returns
+    -------
+    tuple of torch.Tensor
+        (temperature (N,), gradient (N, 3))
+    """
+
+    def temperature_at(point):
+        return model(point.unsqueeze(0))[0]
+
+    gradient, temperature = vmap(grad_and_value(temperature_at))(points)
+
+    # Boundary residuals are formed in at least FP32 even under BF16
+    # autocast
+    return _at_least_fp32(temperature), _at_least_fp32(gradient)
 
 
 # Boundary condition: Base heat flux
 
 def base_heat_flux_loss(
-    model: torch.nn.Module,
-    base_points: torch.Tensor,
+    temperature_gradient: torch.Tensor,
     heat_flux: float,
     thermal_conductivity: float
 ) -> torch.Tensor:
@@ -80,20 +99,11 @@ def base_heat_flux_loss(
     Enforce heat flux at the die–base interface:
         -k * dT/dn = q''
 
-    Assumes normal direction is +z.
+    Assumes normal direction is +z. `temperature_gradient` is the
+    (N, 3) gradient at the base points.
     """
 
-    base_points.requires_grad_(True)
-    temperature = model(base_points)
-
-    grads = torch.autograd.grad(
-        outputs=temperature,
-        inputs=base_points,
-        grad_outputs=torch.ones_like(temperature),
-        create_graph=True
-    )[0]
-
-    dT_dz = grads[:, 2]
+    dT_dz = temperature_gradient[:, 2]
     flux_residual = -thermal_conductivity * dT_dz - heat_flux
 
     return torch.mean(flux_residual ** 2)
@@ -102,8 +112,8 @@ def base_heat_flux_loss(
 # Boundary condition: Convective surfaces
 
 def convection_boundary_loss(
-    model: torch.nn.Module,
-    surface_points: torch.Tensor,
+    temperature: torch.Tensor,
+    temperature_gradient: torch.Tensor,
     heat_transfer_coefficient: float,
     ambient_temperature: float,
     thermal_conductivity: float
@@ -112,23 +122,14 @@ def convection_boundary_loss(
     Enforce convective boundary condition:
         -k * dT/dn = h (T - T_ambient)
 
-    Assumes outward normal is +z.
+    Assumes outward normal is +z. `temperature` (N,) and
+    `temperature_gradient` (N, 3) are evaluated at the surface points.
     """
 
-    surface_points.requires_grad_(True)
-    temperature = model(surface_points)
-
-    grads = torch.autograd.grad(
-        outputs=temperature,
-        inputs=surface_points,
-        grad_outputs=torch.ones_like(temperature),
-        create_graph=True
-    )[0]
-
-    dT_dz = grads[:, 2]
+    dT_dz = temperature_gradient[:, 2]
     convective_residual = (
         -thermal_conductivity * dT_dz
-        - heat_transfer_coefficient * (temperature.squeeze() - ambient_temperature)
+        - heat_transfer_coefficient * (temperature - ambient_temperature)
     )
 
     return torch.mean(convective_residual ** 2)
@@ -137,14 +138,15 @@ def convection_boundary_loss(
 # Consistency with lumped thermal model
 
 def lumped_model_consistency_loss(
-    model: torch.nn.Module,
-    base_points: torch.Tensor,
+    base_temperature: torch.Tensor,
     expected_base_temperature: float
 ) -> torch.Tensor:
     """
     Enforce consistency with lumped thermal model:
         mean(T_base_PINN) ≈ T_base_lumped
+
+    `base_temperature` (N,) is the PINN temperature at the base points,
+    shared with the heat flux loss rather than recomputed.
     """
 
-    temperature = model(base_points).squeeze()
-    return torch.mean((temperature - expected_base_temperature) ** 2)
+    return torch.mean((base_temperature - expected_base_temperature) ** 2)
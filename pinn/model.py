@@ -16,7 +16,7 @@ class ThermalPINN(nn.Module):
         (x, y, z)
 
     Output:
-        T (temperature)
+        T (temperature), one value per input point
     """
 
     def __init__(
@@ -30,32 +30,45 @@ class ThermalPINN(nn.Module):
         if num_hidden_layers < 1:
             raise ValueError("Number of hidden layers must be >= 1")
 
-        layers = []
+        # Layer parameters are held directly and chained in forward()
+        # with addmm/tanh, avoiding per-submodule Module dispatch.
+        # weights[i] has shape (out_features, in_features) as in nn.Linear.
+        dims = [input_dim] + [hidden_dim] * num_hidden_layers + [1]
 
-        # Input layer
-        layers.append(nn.Linear(input_dim, hidden_dim))
-        layers.append(nn.Tanh())
-
-        # Hidden layers
-        for _ in range(num_hidden_layers - 1):
-            layers.append(nn.Linear(hidden_dim, hidden_dim))
-            layers.append(nn.Tanh())
-
-        # Output layer
-        layers.append(nn.Linear(hidden_dim, 1))
-
-        self.network = nn.Sequential(*layers)
+        self.weights = nn.ParameterList(
+            nn.Parameter(torch.empty(d_out, d_in))
+            for d_in, d_out in zip(dims[:-1], dims[1:])
+        )
+        self.biases = nn.ParameterList(
+            nn.Parameter(torch.empty(d_out))
+            for d_out in dims[1:]
+        )
 
         self._initialize_weights()
 
+        self._register_load_state_dict_pre_hook(self._upgrade_state_dict)
+
     def _initialize_weights(self):
         """
         Xavier initialization for stable PINN training.
         """
-        for m in self.network:
-            if isinstance(m, nn.Linear):
-                nn.init.xavier_uniform_(m.weight)
-                nn.init.zeros_(m.bias)
+        for weight, bias in zip(self.weights, self.biases):
+            nn.init.xavier_uniform_(weight)
+            nn.init.zeros_(bias)
+
+    @staticmethod
+    def _upgrade_state_dict(state_dict, prefix, *args):
+        """
+        Map checkpoints saved from the former nn.Sequential layout
+        (network.<2i>.weight / .bias) onto weights.<i> / biases.<i>.
+        """
+        old_prefix = prefix + "network."
+
+        for key in [k for k in state_dict if k.startswith(old_prefix)]:
+            index, name = key[len(old_prefix):].split(".")
+            layer = int(index) // 2
+            new_name = "weights" if name == "weight" else "biases"
+            state_dict[f"{prefix}{new_name}.{layer}"] = state_dict.pop(key)
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """
@@ -69,10 +82,16 @@ class ThermalPINN(nn.Module):
         Returns
         -------
         torch.Tensor
-            Temperature predictions of shape (N, 1)
+            Temperature predictions of shape (N,)
         """
 
         if x.ndim != 2 or x.shape[1] != 3:
             raise ValueError("Input tensor must have shape (N, 3)")
 
-        return self.network(x)
+        *hidden, (w_out, b_out) = zip(self.weights, self.biases)
+
+        h = x
+        for weight, bias in hidden:
+            h = torch.addmm(bias, h, weight.t()).tanh_()
+
+        return torch.addmm(b_out, h, w_out.t()).squeeze(-1)
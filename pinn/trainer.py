@@ -12,6 +12,7 @@ import torch.optim as optim
 
 from pinn.losses import (
     pde_residual_loss,
+    temperature_and_gradient,
     base_heat_flux_loss,
     convection_boundary_loss,
     lumped_model_consistency_loss
@@ -32,7 +33,8 @@ class PINNTrainer:
         heat_transfer_coefficient: float,
         ambient_temperature: float,
         expected_base_temperature: float,
-        device: str = "cpu"
+        device: str = "cpu",
+        compile_losses: bool = False
     ):
         self.model = model.to(device)
         self.domain = domain
@@ -43,6 +45,16 @@ class PINNTrainer:
         self.T_base_expected = expected_base_temperature
         self.device = device
 
+        # All derivatives are taken with torch.func, so the whole loss
+        # pipeline compiles into one graph; shapes are static, so
+        # changing the point counts recompiles. The model itself is not
+        # compiled: compiled modules cannot run under torch.func
+        # transforms.
+        if compile_losses:
+            self._compute_losses = torch.compile(
+                self._compute_losses, fullgraph=True, dynamic=False
+            )
+
     def train(
         self,
         epochs: int = 5000,
@@ -50,7 +62,9 @@ class PINNTrainer:
         n_interior: int = 2000,
         n_base: int = 500,
         n_surface: int = 500,
-        loss_weights: dict | None = None
+        loss_weights: dict | None = None,
+        cuda_graph: bool = False,
+        mixed_precision: bool = False
     ):
         """
         Train the PINN.
@@ -69,6 +83,14 @@ class PINNTrainer:
             Number of convective surface points
         loss_weights : dict
             Optional weights for loss components
+        cuda_graph : bool
+            Capture the whole training step (forward, backward and
+            optimizer update) into a CUDA graph once and replay it every
+            epoch. CUDA devices only; point counts are fixed for the run.
+        mixed_precision : bool
+            Run the network under BF16 autocast. Parameters, optimizer
+            state and the loss reductions stay in FP32, so no gradient
+            scaling is needed. Combining it with cuda_graph is untested.
         """
 
         if loss_weights is None:
@@ -79,72 +101,204 @@ class PINNTrainer:
                 "lumped": 0.5
             }
 
-        optimizer = optim.Adam(self.model.parameters(), lr=lr)
+        if cuda_graph and not str(self.device).startswith("cuda"):
+            raise ValueError("CUDA graph capture requires a CUDA device")
+
+        # Fused Adam updates all parameters in one kernel on CUDA;
+        # capturable keeps its step counters on the device so the update
+        # can be recorded in a graph
+        optimizer = optim.Adam(
+            self.model.parameters(),
+            lr=lr,
+            fused=str(self.device).startswith("cuda"),
+            capturable=cuda_graph
+        )
+
+        if cuda_graph:
+            step = self._capture_training_step(
+                optimizer, loss_weights, mixed_precision,
+                n_interior, n_base, n_surface
+            )
+        else:
+            def step(points):
+                return self._training_step(
+                    optimizer, loss_weights, mixed_precision, *points
+                )
 
         for epoch in range(1, epochs + 1):
 
-            
             # Sample domain points
-            interior_pts = torch.tensor(
-                self.domain.sample_interior(n_interior),
-                dtype=torch.float32,
-                device=self.device
-            )
+            points = self._sample_points(n_interior, n_base, n_surface)
 
-            base_pts = torch.tensor(
-                self.domain.sample_base(n_base),
-                dtype=torch.float32,
-                device=self.device
-            )
+            losses = step(points)
 
-            surface_pts = torch.tensor(
-                self.domain.sample_top(n_surface),
-                dtype=torch.float32,
-                device=self.device
-            )
+            if epoch % 500 == 0 or epoch == 1:
+                # One device-to-host transfer for all five values
+                total, pde, base, conv, lumped = torch.stack(
+                    [loss.detach() for loss in losses]
+                ).tolist()
+                print(
+                    f"[Epoch {epoch:5d}] "
+                    f"Total={total:.4e} | "
+                    f"PDE={pde:.2e} | "
+                    f"Base={base:.2e} | "
+                    f"Conv={conv:.2e} | "
+                    f"Lumped={lumped:.2e}"
+                )
 
-            loss_pde = pde_residual_loss(
-                self.model, interior_pts, self.k
-            )
+    def _training_step(
+        self,
+        optimizer,
+        loss_weights: dict,
+        mixed_precision: bool,
+        interior_pts: torch.Tensor,
+        base_pts: torch.Tensor,
+        surface_pts: torch.Tensor
+    ) -> tuple:
+        """
+        One optimization step.
 
-            loss_base = base_heat_flux_loss(
-                self.model, base_pts, self.q_flux, self.k
-            )
+        Returns (total, pde, base, conv, lumped) loss tensors.
+        """
 
-            loss_conv = convection_boundary_loss(
-                self.model,
-                surface_pts,
-                self.h,
-                self.T_ambient,
-                self.k
-            )
+        # The autocast weight-cast cache must be off while a CUDA graph
+        # is being captured; eager steps keep it
+        capturing = (
+            torch.cuda.is_available() and torch.cuda.is_current_stream_capturing()
+        )
 
-            loss_lumped = lumped_model_consistency_loss(
-                self.model,
-                base_pts,
-                self.T_base_expected
+        with torch.autocast(
+            torch.device(self.device).type,
+            dtype=torch.bfloat16,
+            enabled=mixed_precision,
+            cache_enabled=not capturing
+        ):
+            loss_pde, loss_base, loss_conv, loss_lumped = self._compute_losses(
+                interior_pts, base_pts, surface_pts
             )
 
-            total_loss = (
-                loss_weights["pde"] * loss_pde
-                + loss_weights["base"] * loss_base
-                + loss_weights["conv"] * loss_conv
-                + loss_weights["lumped"] * loss_lumped
-            )
+        total_loss = (
+            loss_weights["pde"] * loss_pde
+            + loss_weights["base"] * loss_base
+            + loss_weights["conv"] * loss_conv
+            + loss_weights["lumped"] * loss_lumped
+        )
 
-            optimizer.zero_grad()
-            total_loss.backward()
-            optimizer.step()
+        optimizer.zero_grad(set_to_none=True)
+        total_loss.backward()
+        optimizer.step()
 
-            if epoch % 500 == 0 or epoch == 1:
-                print(
-                    f"[Epoch {epoch:5d}] "
-                    f"Total={total_loss.item():.4e} | "
-                    f"PDE={loss_pde.item():.2e} | "
-                    f"Base={loss_base.item():.2e} | "
-                    f"Conv={loss_conv.item():.2e} | "
-                    f"Lumped={loss_lumped.item():.2e}"
+        return total_loss, loss_pde, loss_base, loss_conv, loss_lumped
+
+    def _compute_losses(
+        self,
+        interior_pts: torch.Tensor,
+        base_pts: torch.Tensor,
+        surface_pts: torch.Tensor
+    ) -> tuple:
+        """
+        Evaluate the physics losses.
+
+        Returns (pde, base, conv, lumped) loss tensors.
+        """
+
+        loss_pde = pde_residual_loss(
+            self.model, interior_pts, self.k
+        )
+
+        # Base and top surface points share one forward/backward pass.
+        # Interior points stay separate: folding them in would take
+        # second derivatives at every boundary point as well.
+        n_base = base_pts.shape[0]
+        temperature, gradient = temperature_and_gradient(
+            self.model, torch.cat((base_pts, surface_pts))
+        )
+
+        loss_base = base_heat_flux_loss(
+            gradient[:n_base], self.q_flux, self.k
+        )
+
+        loss_conv = convection_boundary_loss(
+            temperature[n_base:],
+            gradient[n_base:],
+            self.h,
+            self.T_ambient,
+            self.k
+        )
+
+        loss_lumped = lumped_model_consistency_loss(
+            temperature[:n_base], self.T_base_expected
+        )
+
+        return loss_pde, loss_base, loss_conv, loss_lumped
+
+    def _capture_training_step(
+        self,
+        optimizer,
+        loss_weights: dict,
+        mixed_precision: bool,
+        n_interior: int,
+        n_base: int,
+        n_surface: int
+    ):
+        """
+        Record _training_step into a CUDA graph.
+
+        Returns a step function that copies freshly sampled points into
+        the graph's static input buffers and replays it. The returned
+        loss tensors are the graph's static outputs, overwritten by
+        every replay.
+        """
+
+        static_points = self._sample_points(n_interior, n_base, n_surface)
+
+        # Warm up on a side stream so lazy allocations (optimizer state,
+        # autograd and cuBLAS workspaces) happen before capture
+        side_stream = torch.cuda.Stream()
+        side_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(side_stream):
+            for _ in range(3):
+                self._training_step(
+                    optimizer, loss_weights, mixed_precision, *static_points
                 )
+        torch.cuda.current_stream().wait_stream(side_stream)
+
+        graph = torch.cuda.CUDAGraph()
+        optimizer.zero_grad(set_to_none=True)
+        with torch.cuda.graph(graph):
+            static_losses = self._training_step(
+                optimizer, loss_weights, mixed_precision, *static_points
+            )
+
+        def step(points):
+            with torch.no_grad():
+                for static, new in zip(static_points, points):
+                    static.copy_(new)
+            graph.replay()
+            return static_losses
+
+        return step
+
+    def _sample_points(self, n_interior: int, n_base: int, n_surface: int):
+        """
+        Draw interior, base and top collocation points on self.device.
+
+        On accelerators the points are generated on the device itself,
+        so no host-to-device copy happens per epoch.
+        """
+
+        if str(self.device) != "cpu":
+            return (
+                self.domain.sample_interior_torch(n_interior, self.device),
+                self.domain.sample_base_torch(n_base, self.device),
+                self.domain.sample_top_torch(n_surface, self.device)
+            )
+
+        return (
+            torch.from_numpy(self.domain.sample_interior(n_interior)).float(),
+            torch.from_numpy(self.domain.sample_base(n_base)).float(),
+            torch.from_numpy(self.domain.sample_top(n_surface)).float()
+        )
 
     def save_model(self, path: str):
         """
@@ -10,6 +10,8 @@ Checks:
 import numpy as np
 import torch
 
+from pinn.inference import points_to_tensor
+
 
 # 1. Energy balance check
 
@@ -19,13 +21,19 @@ def check_energy_balance(
     heat_transfer_coefficient: float,
     ambient_temperature: float,
     expected_power: float,
-    tolerance: float = 0.1
+    tolerance: float = 0.1,
+    *,
+    dA_per_point: float
 ) -> bool:
     """
     Validate that total convective heat removal ≈ input power.
 
     ∫ h (T - T_ambient) dA ≈ Q
 
+    The integral is approximated as Σ h (T_i - T_ambient) · ΔA over
+    uniformly sampled surface points, each standing for an area
+    ΔA = total_area / N.
+
     Parameters
     ----------
     model : torch.nn.Module
@@ -40,6 +48,8 @@ def check_energy_balance(
         Input heat power (W)
     tolerance : float
         Relative tolerance (fraction)
+    dA_per_point : float
+        Surface area represented by each point (m², keyword-only)
 
     Returns
     -------
@@ -47,13 +57,20 @@ def check_energy_balance(
         True if energy balance is satisfied
     """
 
+    if dA_per_point <= 0:
+        raise ValueError("Area per point must be positive")
+
     model.eval()
     with torch.no_grad():
-        pts = torch.tensor(surface_points, dtype=torch.float32)
-        temperatures = model(pts).cpu().numpy().flatten()
+        pts = points_to_tensor(surface_points)
+        temperatures = model(pts).cpu().numpy()
 
-    heat_flux = heat_transfer_coefficient * (temperatures - ambient_temperature)
-    estimated_power = np.mean(heat_flux)
+    # Σ h (T_i - T_amb) ΔA, reduced in one pass without an (N,) flux array
+    estimated_power = (
+        heat_transfer_coefficient
+        * (temperatures.sum(dtype=np.float64) - temperatures.size * ambient_temperature)
+        * dA_per_point
+    )
 
     relative_error = abs(estimated_power - expected_power) / expected_power
     return relative_error <= tolerance
@@ -89,8 +106,8 @@ def check_lumped_model_consistency(
 
     model.eval()
     with torch.no_grad():
-        pts = torch.tensor(base_points, dtype=torch.float32)
-        temperatures = model(pts).cpu().numpy().flatten()
+        pts = points_to_tensor(base_points)
+        temperatures = model(pts).cpu().numpy()
 
     mean_base_temperature = np.mean(temperatures)
     return abs(mean_base_temperature - expected_base_temperature) <= tolerance
@@ -114,14 +131,13 @@ def check_temperature_monotonicity(
         True if monotonicity condition holds
     """
 
+    # Base and top points share one forward pass
+    n_base = len(base_points)
+
     model.eval()
     with torch.no_grad():
-        base_temps = model(
-            torch.tensor(base_points, dtype=torch.float32)
-        ).cpu().numpy().flatten()
-
-        top_temps = model(
-            torch.tensor(top_points, dtype=torch.float32)
-        ).cpu().numpy().flatten()
+        temperatures = model(
+            points_to_tensor(np.concatenate((base_points, top_points)))
+        ).cpu().numpy()
 
-    return np.mean(base_temps) > np.mean(top_temps)
+    return np.mean(temperatures[:n_base]) > np.mean(temperatures[n_base:])
@@ -1,13 +1,60 @@
 """
-Production server runner for Windows compatibility.
+Production server runner.
+
+Linux/macOS: gunicorn with one worker process per core, up to 4 (gthread),
+configured by gunicorn.conf.py, so CPU-bound solves run in parallel.
+Windows: waitress, which has no fork support, as a threaded fallback.
+
+Both bind the address resolved by gunicorn.conf.py
+(FLASK_HOST, PORT / FLASK_PORT).
 """
 
-from waitress import serve
-from app.main import create_app
+import os
+import runpy
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+GUNICORN_CONFIG = PROJECT_ROOT / "gunicorn.conf.py"
+
+
+def resolve_bind() -> str:
+    return runpy.run_path(str(GUNICORN_CONFIG))["bind"]
+
+
+def run_gunicorn():
+    os.chdir(PROJECT_ROOT)
+
+    # Run gunicorn from this interpreter, so it works from an
+    # unactivated virtualenv without gunicorn on PATH
+    os.execv(
+        sys.executable,
+        [
+            sys.executable, "-m", "gunicorn",
+            "--config", str(GUNICORN_CONFIG),
+            "app.main:create_app()"
+        ]
+    )
+
+
+def run_waitress(bind: str):
+    from waitress import serve
+    from app.main import create_app
+
+    host, port = bind.rsplit(":", 1)
 
-if __name__ == "__main__":
     app = create_app()
-    print("🚀 Starting Thermal Analysis API on http://localhost:5000")
-    print("📊 Health check: http://localhost:5000/health")
-    print("🔥 Thermal analysis: http://localhost:5000/thermal/solve")
-    serve(app, host="0.0.0.0", port=5000)
+    serve(app, host=host, port=int(port), threads=(os.cpu_count() or 1) * 2)
+
+
+if __name__ == "__main__":
+    bind = resolve_bind()
+
+    print(f"🚀 Starting Thermal Analysis API on http://{bind}")
+    print(f"📊 Health check: http://{bind}/health")
+    print(f"🔥 Thermal analysis: http://{bind}/thermal/solve")
+
+    if sys.platform == "win32":
+        run_waitress(bind)
+    else:
+        run_gunicorn()
@@ -102,3 +102,50 @@ def test_thermal_solve_invalid_json(client):
     )
 
     assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_health_endpoint_uses_orjson_provider(client):
+    """
+    Responses are encoded by the orjson provider, including NumPy scalars.
+    """
+
+    import numpy as np
+
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "ok"
+
+    app = client.application
+    assert app.json.dumps({"value": np.float64(1.5)}) == '{"value":1.5}'
+
+
+def test_thermal_solve_batch_matches_single(client, reference_payload):
+    """
+    Batch endpoint returns one result per payload, matching /thermal/solve.
+    """
+
+    laminar = reference_payload
+    turbulent = json.loads(json.dumps(reference_payload))
+    turbulent["air"]["velocity"] = 40.0
+
+    batch = client.post("/thermal/solve/batch", json=[laminar, turbulent])
+    assert batch.status_code == 200
+
+    results = batch.get_json()
+    assert len(results) == 2
+
+    for payload, result in zip([laminar, turbulent], results):
+        single = client.post("/thermal/solve", json=payload).get_json()
+        assert result["junction_temperature"] == pytest.approx(
+            single["junction_temperature"], rel=1e-12
+        )
+
+
+def test_thermal_solve_batch_rejects_non_list(client, reference_payload):
+    """
+    Batch endpoint requires a non-empty JSON array.
+    """
+
+    response = client.post("/thermal/solve/batch", json=reference_payload)
+    assert response.status_code == 400
@@ -0,0 +1,70 @@
+"""
+Unit tests for the vectorized thermal network solver.
+"""
+
+import numpy as np
+import pytest
+
+from core.batch import compute_nusselt_number_batch, solve_thermal_network_batch
+from core.convection import compute_nusselt_number
+from app.services.thermal_service import _solve_thermal_network
+
+
+# Reference inputs in solver argument order
+REFERENCE_INPUTS = (
+    0.0525, 0.045, 150.0,                          # processor
+    0.09, 0.116, 0.0025, 60, 0.0008, 0.0245, 167.0,  # heat sink
+    4.0, 0.0001,                                   # TIM
+    1.0, 0.0262, 1.57e-5, 0.71,                    # air
+    25.0, 0.1                                      # ambient, Rjc
+)
+
+
+def test_batch_matches_scalar_solver():
+    """
+    Batch results should match the scalar solver across both flow regimes.
+    """
+
+    rows = []
+    for velocity in (0.5, 1.0, 5.0, 40.0, 60.0):
+        row = list(REFERENCE_INPUTS)
+        row[12] = velocity
+        rows.append(tuple(row))
+
+    columns = np.array(rows, dtype=np.float64).T
+    results = np.column_stack(solve_thermal_network_batch(*columns))
+
+    for row, batch_result in zip(rows, results):
+        expected = _solve_thermal_network.__wrapped__(*row)
+        assert batch_result == pytest.approx(expected, rel=1e-12)
+
+
+def test_batch_invalid_fin_geometry():
+    """
+    Any infeasible geometry in the batch should fail the whole batch.
+    """
+
+    good = list(REFERENCE_INPUTS)
+    bad = list(REFERENCE_INPUTS)
+    bad[4] = 0.04  # 60 fins x 0.8 mm do not fit in 40 mm
+
+    columns = np.array([good, bad], dtype=np.float64).T
+
+    with pytest.raises(ValueError):
+        solve_thermal_network_batch(*columns)
+
+
+def test_nusselt_batch_matches_scalar_across_transition():
+    """
+    Branch-free Nusselt should match the scalar correlation on both sides of Re = 2300.
+    """
+
+    re = np.array([100.0, 2299.0, 2300.0, 2301.0, 10000.0])
+    pr = np.full_like(re, 0.71)
+    spacing = np.full_like(re, 0.001153)
+    height = np.full_like(re, 0.0245)
+
+    nu = compute_nusselt_number_batch(re, pr, spacing, height)
+
+    expected = [compute_nusselt_number(r, 0.71, 0.001153, 0.0245) for r in re]
+    assert nu == pytest.approx(expected, rel=1e-12)
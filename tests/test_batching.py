@@ -0,0 +1,72 @@
+"""
+Unit tests for dynamic inference batching.
+"""
+
+import threading
+import time
+
+import pytest
+
+from batching import BatchPredictor
+
+
+def test_batch_predictor_returns_per_row_outputs():
+    """
+    Concurrent callers each receive the output for their own row.
+    """
+
+    batch_sizes = []
+
+    def predict_fn(inputs):
+        batch_sizes.append(len(inputs))
+        return inputs.sum(axis=1).tolist()
+
+    batcher = BatchPredictor(predict_fn, n_features=3, batch_size=8, max_latency=0.05)
+    results = {}
+
+    def submit(i):
+        results[i] = batcher.predict((i, 1.0, 2.0))
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {i: pytest.approx(i + 3.0) for i in range(20)}
+    assert max(batch_sizes) <= 8
+    assert sum(batch_sizes) == 20
+
+
+def test_single_request_is_not_held_for_max_latency():
+    """
+    A lone row is served as soon as it is queued, not after the window.
+    """
+
+    batcher = BatchPredictor(
+        lambda inputs: inputs.sum(axis=1).tolist(),
+        n_features=3,
+        max_latency=0.5
+    )
+    batcher.predict((0.0, 0.0, 0.0))  # start the worker
+
+    start = time.perf_counter()
+    result = batcher.predict((1.0, 2.0, 3.0))
+    elapsed = time.perf_counter() - start
+
+    assert result == pytest.approx(6.0)
+    assert elapsed < 0.05
+
+
+def test_batch_predictor_propagates_errors():
+    """
+    Exceptions raised by the prediction function reach the caller.
+    """
+
+    def predict_fn(inputs):
+        raise ValueError("bad batch")
+
+    batcher = BatchPredictor(predict_fn, n_features=3)
+
+    with pytest.raises(ValueError):
+        batcher.predict((1.0, 2.0, 3.0))
@@ -2,13 +2,16 @@
 Unit tests for forced convection thermal resistance.
 """
 
+import math
+
 import pytest
 
 from core.convection import (
     compute_reynolds_number,
     compute_nusselt_number,
     compute_heat_transfer_coefficient,
-    compute_convection_resistance
+    compute_convection_resistance,
+    _compute_convection_resistance_fast
 )
 
 
@@ -126,3 +129,64 @@ def test_convection_resistance_invalid_area():
             kinematic_viscosity=1.57e-5,
             prandtl_number=0.71
         )
+
+
+def _reference_convection_resistance(
+    air_velocity,
+    fin_spacing,
+    fin_height,
+    total_convection_area,
+    air_thermal_conductivity,
+    kinematic_viscosity,
+    prandtl_number,
+    fin_thickness=0.0008,
+    sink_thermal_conductivity=167.0
+):
+    """
+    Plain-Python evaluation of the convection model (no Numba).
+    """
+
+    re = air_velocity * fin_spacing / kinematic_viscosity
+
+    if re < 2300:
+        nu = 1.86 * (re * prandtl_number * (2 * fin_spacing / fin_height)) ** (1.0 / 3.0)
+    else:
+        nu = 0.023 * re ** 0.8 * prandtl_number ** 0.3
+
+    h = nu * air_thermal_conductivity / (2 * fin_spacing)
+
+    m_l = math.sqrt(2.0 * h / (sink_thermal_conductivity * fin_thickness)) * fin_height
+    fin_efficiency = (1.0 if m_l > 10 else math.tanh(m_l)) / m_l
+
+    return 1.0 / (h * total_convection_area * fin_efficiency)
+
+
+@pytest.mark.parametrize(
+    "air_velocity, prandtl_number",
+    [(1.0, 0.71), (1, 0.71), (2.0, 1), (40.0, 0.71)]
+)
+def test_convection_resistance_matches_python_reference(air_velocity, prandtl_number):
+    """
+    Compiled kernels agree with plain-Python arithmetic, in both flow
+    regimes and for int as well as float arguments.
+    """
+
+    kwargs = dict(
+        air_velocity=air_velocity,
+        fin_spacing=0.001153,
+        fin_height=0.0245,
+        total_convection_area=0.265,
+        air_thermal_conductivity=0.0262,
+        kinematic_viscosity=1.57e-5,
+        prandtl_number=prandtl_number
+    )
+
+    expected = _reference_convection_resistance(**kwargs)
+
+    assert compute_convection_resistance(**kwargs) == pytest.approx(expected, rel=1e-9)
+    assert _compute_convection_resistance_fast(
+        **kwargs, fin_thickness=0.0008, sink_thermal_conductivity=167.0
+    ) == pytest.approx(expected, rel=1e-9)
+
+    with pytest.raises(ValueError):
+        compute_convection_resistance(**kwargs, sink_thermal_conductivity=0.0)
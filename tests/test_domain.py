@@ -0,0 +1,107 @@
+"""
+Unit tests for PINN domain sampling.
+"""
+
+import numpy as np
+import pytest
+import torch
+
+from pinn.domain import HeatSinkDomain
+
+
+@pytest.fixture
+def domain():
+    return HeatSinkDomain(
+        sink_length=0.09,
+        sink_width=0.116,
+        fin_height=0.0245,
+        base_thickness=0.0025
+    )
+
+
+def test_sample_side_walls_on_walls(domain):
+    """
+    Every side-wall point lies on one of the four vertical faces.
+    """
+
+    points = domain.sample_side_walls(10000)
+
+    assert points.shape == (10000, 3)
+    assert points.dtype == np.float32
+
+    x_min, x_max, y_min, y_max, z_min, z_max = np.float32([
+        domain.x_min, domain.x_max,
+        domain.y_min, domain.y_max,
+        domain.z_min, domain.z_max
+    ])
+
+    x, y, z = points.T
+    on_x_face = (x == x_min) | (x == x_max)
+    on_y_face = (y == y_min) | (y == y_max)
+
+    assert np.all(on_x_face | on_y_face)
+    assert np.all((x >= x_min) & (x <= x_max))
+    assert np.all((y >= y_min) & (y <= y_max))
+    assert np.all((z >= z_min) & (z <= z_max))
+
+    # All four faces are sampled
+    assert np.any(x == x_min) and np.any(x == x_max)
+    assert np.any(y == y_min) and np.any(y == y_max)
+
+
+def test_seed_makes_sampling_reproducible():
+    """
+    Domains built with the same seed produce identical point sets.
+    """
+
+    kwargs = dict(sink_length=0.09, sink_width=0.116, fin_height=0.0245, base_thickness=0.0025)
+    a = HeatSinkDomain(**kwargs, seed=0)
+    b = HeatSinkDomain(**kwargs, seed=0)
+
+    np.testing.assert_array_equal(a.sample_interior(100), b.sample_interior(100))
+    np.testing.assert_array_equal(a.sample_side_walls(100), b.sample_side_walls(100))
+
+
+def test_seed_makes_torch_sampling_reproducible():
+    """
+    The seed also covers the tensor samplers, independent of torch's
+    global RNG.
+    """
+
+    kwargs = dict(sink_length=0.09, sink_width=0.116, fin_height=0.0245, base_thickness=0.0025)
+    a = HeatSinkDomain(**kwargs, seed=0)
+    b = HeatSinkDomain(**kwargs, seed=0)
+
+    first = a.sample_interior_torch(100)
+    torch.rand(10)
+    second = b.sample_interior_torch(100)
+
+    assert torch.equal(first, second)
+    assert torch.equal(a.sample_top_torch(50), b.sample_top_torch(50))
+
+
+def test_sample_rejects_non_positive_count(domain):
+    with pytest.raises(ValueError):
+        domain.sample_side_walls(0)
+
+
+def test_torch_samplers_match_numpy_layout(domain):
+    """
+    Tensor samplers return float32 (N, 3) points on the same surfaces.
+    """
+
+    interior = domain.sample_interior_torch(1000)
+    base = domain.sample_base_torch(200)
+    top = domain.sample_top_torch(200)
+
+    assert interior.shape == (1000, 3)
+    assert interior.dtype == torch.float32
+    assert torch.all(interior[:, 0] <= domain.x_max)
+    assert torch.all(interior[:, 1] <= domain.y_max)
+    assert torch.all(interior[:, 2] <= domain.z_max)
+    assert torch.all(interior >= 0)
+
+    assert torch.all(base[:, 2] == torch.tensor(domain.base_z))
+    assert torch.all(top[:, 2] == torch.tensor(domain.z_max))
+    assert torch.all(base[:, 0] <= domain.x_max)
+    assert torch.all(top[:, 1] <= domain.y_max)
@@ -0,0 +1,104 @@
+"""
+Unit tests for PINN inference and validation helpers.
+"""
+
+import numpy as np
+import pytest
+import torch
+
+from pinn.inference import (
+    points_to_tensor,
+    predict_temperature,
+    to_device_once
+)
+from pinn.model import ThermalPINN
+from pinn.validation import (
+    check_energy_balance,
+    check_temperature_monotonicity
+)
+
+
+def test_points_to_tensor_shares_float32_memory():
+    points = np.random.rand(10, 3).astype(np.float32)
+
+    inputs = points_to_tensor(points)
+
+    assert inputs.dtype == torch.float32
+    assert np.shares_memory(inputs.numpy(), points)
+
+
+def test_points_to_tensor_converts_float64():
+    points = np.random.rand(10, 3)
+
+    inputs = points_to_tensor(points)
+
+    assert inputs.dtype == torch.float32
+    np.testing.assert_allclose(inputs.numpy(), points, rtol=1e-6)
+
+
+def test_predict_temperature_shape():
+    torch.manual_seed(0)
+    model = ThermalPINN(hidden_dim=8, num_hidden_layers=2)
+
+    temperatures = predict_temperature(model, np.random.rand(5, 3))
+
+    assert temperatures.shape == (5,)
+
+
+def test_to_device_once_keeps_model_in_place():
+    model = ThermalPINN(hidden_dim=8, num_hidden_layers=2)
+    weight = model.weights[0]
+
+    assert to_device_once(model, "cpu") is model
+    assert model.weights[0] is weight
+    assert weight.device == torch.device("cpu")
+
+
+class LinearInZ(torch.nn.Module):
+    """
+    T = 100 - 1000 z, decreasing from base to fin tip.
+    """
+
+    def forward(self, x):
+        return 100.0 - 1000.0 * x[:, 2]
+
+
+def test_check_temperature_monotonicity():
+    base = np.column_stack((np.random.rand(20, 2), np.full(20, 0.0025)))
+    top = np.column_stack((np.random.rand(30, 2), np.full(30, 0.027)))
+
+    assert check_temperature_monotonicity(LinearInZ(), base, top)
+    assert not check_temperature_monotonicity(LinearInZ(), top, base)
+
+
+class Uniform(torch.nn.Module):
+    """
+    Uniform 45 °C temperature field.
+    """
+
+    def forward(self, x):
+        return torch.full((x.shape[0],), 45.0)
+
+
+def test_check_energy_balance_integrates_over_area():
+    """
+    h (T - T_amb) A = 50 * 20 * 0.01 = 10 W, split over 100 points.
+    """
+
+    points = np.random.rand(100, 3)
+
+    assert check_energy_balance(
+        Uniform(), points, 50.0, 25.0, 10.0, dA_per_point=0.01 / 100
+    )
+    assert not check_energy_balance(
+        Uniform(), points, 50.0, 25.0, 1000.0, dA_per_point=0.01 / 100
+    )
+
+
+def test_check_energy_balance_area_is_keyword_only():
+    """
+    An old positional tolerance cannot be mistaken for the area.
+    """
+
+    with pytest.raises(TypeError):
+        check_energy_balance(Uniform(), np.random.rand(4, 3), 50.0, 25.0, 10.0, 0.05)
@@ -0,0 +1,60 @@
+"""
+Unit tests for the PINN physics losses.
+"""
+
+import pytest
+import torch
+
+from pinn.losses import (
+    convection_boundary_loss,
+    pde_residual_loss,
+    temperature_and_gradient
+)
+
+
+class QuadraticField(torch.nn.Module):
+    """
+    T(x, y, z) = x^2 + 2y^2 + 3z^2, whose Laplacian is 12 everywhere.
+    """
+
+    def forward(self, x):
+        coefficients = torch.tensor([1.0, 2.0, 3.0])
+        return (coefficients * x ** 2).sum(dim=1)
+
+
+def test_pde_residual_uses_exact_laplacian():
+    """
+    Residual k * ∇²T matches the analytic Laplacian.
+    """
+
+    points = torch.rand(64, 3)
+    k = 2.0
+
+    loss = pde_residual_loss(QuadraticField(), points, k)
+
+    assert loss.item() == pytest.approx((k * 12.0) ** 2, rel=1e-5)
+
+
+def test_temperature_and_gradient_match_analytic_field():
+    points = torch.rand(32, 3)
+    x, y, z = points.T
+
+    temperature, gradient = temperature_and_gradient(QuadraticField(), points)
+
+    assert temperature.shape == (32,)
+    torch.testing.assert_close(temperature, x ** 2 + 2 * y ** 2 + 3 * z ** 2)
+    torch.testing.assert_close(gradient, torch.stack((2 * x, 4 * y, 6 * z), dim=1))
+
+
+def test_convection_residual_vanishes_when_balanced():
+    """
+    -k dT/dz equal to h (T - T_ambient) gives zero loss.
+    """
+
+    temperature = torch.tensor([30.0, 40.0])
+    gradient = torch.zeros(2, 3)
+    gradient[:, 2] = -2.0 * (temperature - 25.0) / 10.0
+
+    loss = convection_boundary_loss(temperature, gradient, 2.0, 25.0, 10.0)
+
+    assert loss.item() == pytest.approx(0.0, abs=1e-10)
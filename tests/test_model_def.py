@@ -0,0 +1,79 @@
+"""
+Unit tests for the served PINN model and its inference variants.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import torch
+
+from model_def import PINN, NumpyPINN
+
+
+MODEL_DIR = Path(__file__).resolve().parent.parent / "model"
+
+
+@pytest.fixture
+def inputs():
+    """
+    Random (power, fin_height, air_velocity) rows in the served range.
+    """
+    rng = np.random.default_rng(0)
+    return (
+        rng.uniform([10.0, 0.005, 0.2], [250.0, 0.05, 3.0], size=(32, 3))
+        .astype(np.float32)
+    )
+
+
+def test_fold_input_scaling_preserves_outputs(inputs):
+    """
+    Folding the input scales into the first layer must not change outputs.
+    """
+
+    model = PINN().eval()
+    x = torch.from_numpy(inputs)
+
+    with torch.no_grad():
+        expected = model(x)
+        model.fold_input_scaling()
+        folded = model(x)
+
+    assert torch.allclose(folded, expected, rtol=1e-4, atol=1e-5)
+
+
+def test_numpy_pinn_matches_torch(inputs):
+    """
+    NumPy forward pass should match the torch model.
+    """
+
+    model = PINN().eval()
+
+    with torch.no_grad():
+        expected = model(torch.from_numpy(inputs)).numpy()
+
+    np.testing.assert_allclose(NumpyPINN(model)(inputs), expected, rtol=1e-4, atol=1e-5)
+
+
+def test_onnx_export_matches_checkpoint(inputs):
+    """
+    The shipped ONNX graph should reproduce the shipped PyTorch checkpoint.
+    """
+
+    ort = pytest.importorskip("onnxruntime")
+
+    model = PINN().eval()
+    model.load_state_dict(
+        torch.load(MODEL_DIR / "thermal_pinn_model.pth", map_location="cpu")
+    )
+
+    with torch.no_grad():
+        expected = model(torch.from_numpy(inputs)).numpy()
+
+    session = ort.InferenceSession(
+        str(MODEL_DIR / "thermal_pinn_model.onnx"),
+        providers=["CPUExecutionProvider"]
+    )
+    actual = session.run(None, {"input": inputs})[0]
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-4, atol=1e-4)
@@ -0,0 +1,67 @@
+"""
+API tests for the standalone PINN prediction service (app.py).
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="module")
+def client():
+    # app.py is shadowed by the app/ package, so load it by path; it
+    # reads the model checkpoint relative to the project root
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(PROJECT_ROOT)
+        spec = importlib.util.spec_from_file_location(
+            "pinn_api", PROJECT_ROOT / "app.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+    module.app.config["TESTING"] = True
+    return module.app.test_client()
+
+
+def test_predict_success(client):
+    response = client.post(
+        "/thermal/predict",
+        json={"power": 150, "fin_height": 0.03, "air_velocity": 2.0}
+    )
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["inputs"]["ambient_temp"] == 25.0
+    assert "junction_temperature" in data["results"]
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [("ambient_temp", "inf"), ("power", "nan"), ("air_velocity", "-inf")]
+)
+def test_predict_rejects_non_finite_inputs(client, field, value):
+    payload = {"power": 150, "fin_height": 0.03, "air_velocity": 2.0}
+    payload[field] = value
+
+    response = client.post("/thermal/predict", json=payload)
+
+    assert response.status_code == 400
+    assert "finite" in response.get_json()["error"]
+
+
+def test_predict_handles_huge_finite_inputs(client):
+    response = client.post(
+        "/thermal/predict",
+        json={
+            "power": 150,
+            "fin_height": 0.03,
+            "air_velocity": 2.0,
+            "ambient_temp": 1e307
+        }
+    )
+
+    assert response.status_code == 200
+    assert response.get_json()["results"]["junction_temperature"] == 1e307
@@ -0,0 +1,51 @@
+"""
+Unit tests for the thermal PINN network.
+"""
+
+import torch
+import torch.nn as nn
+
+from pinn.model import ThermalPINN
+
+
+def test_forward_matches_sequential_reference():
+    """
+    The addmm/tanh chain computes the same MLP as nn.Sequential.
+    """
+
+    torch.manual_seed(0)
+    model = ThermalPINN(hidden_dim=16, num_hidden_layers=3)
+
+    layers = []
+    for i, (weight, bias) in enumerate(zip(model.weights, model.biases)):
+        linear = nn.Linear(weight.shape[1], weight.shape[0])
+        linear.weight.data.copy_(weight)
+        linear.bias.data.copy_(bias)
+        layers.append(linear)
+        if i < len(model.weights) - 1:
+            layers.append(nn.Tanh())
+    reference = nn.Sequential(*layers)
+
+    x = torch.rand(20, 3)
+    assert model(x).shape == (20,)
+    torch.testing.assert_close(model(x), reference(x)[:, 0])
+
+
+def test_loads_sequential_layout_checkpoint():
+    """
+    Checkpoints saved with the former `network.<i>` keys still load.
+    """
+
+    torch.manual_seed(0)
+    model = ThermalPINN(hidden_dim=16, num_hidden_layers=2)
+
+    legacy = {}
+    for i, (weight, bias) in enumerate(zip(model.weights, model.biases)):
+        legacy[f"network.{2 * i}.weight"] = weight.detach().clone()
+        legacy[f"network.{2 * i}.bias"] = bias.detach().clone()
+
+    restored = ThermalPINN(hidden_dim=16, num_hidden_layers=2)
+    restored.load_state_dict(legacy)
+
+    x = torch.rand(8, 3)
+    torch.testing.assert_close(restored(x), model(x))
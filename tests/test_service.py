@@ -0,0 +1,98 @@
+"""
+Unit tests for the thermal analysis service layer.
+"""
+
+import copy
+import json
+import re
+
+import pytest
+
+from app.schemas import ThermalRequestSchema
+from app.services.thermal_service import (
+    run_thermal_analysis,
+    _solve_thermal_network
+)
+
+
+def test_repeated_requests_hit_cache(reference_payload):
+    """
+    Identical requests are served from the cache as independent dicts.
+    """
+
+    _solve_thermal_network.cache_clear()
+
+    first = run_thermal_analysis(copy.deepcopy(reference_payload))
+    first["resistances"]["total"] = -1.0
+
+    second = run_thermal_analysis(copy.deepcopy(reference_payload))
+
+    assert _solve_thermal_network.cache_info().hits == 1
+    assert second["resistances"]["total"] > 0
+
+
+def test_decoded_request_matches_dict_payload(reference_payload):
+    """
+    A msgspec-decoded request solves identically to the raw dict payload.
+    """
+
+    body = json.dumps(reference_payload).encode()
+    decoded = ThermalRequestSchema.decode(body)
+
+    assert run_thermal_analysis(decoded) == run_thermal_analysis(reference_payload)
+
+
+def test_decode_rejects_non_positive_fields(reference_payload):
+    """
+    Field constraints are enforced during decoding.
+    """
+
+    reference_payload["processor"]["power"] = 0
+    body = json.dumps(reference_payload).encode()
+
+    with pytest.raises(ValueError):
+        ThermalRequestSchema.decode(body)
+
+
+@pytest.mark.parametrize(
+    "section, field, value, message",
+    [
+        ("processor", "power", 0, "Expected `float` > 0.0 - at `$.processor.power`"),
+        ("heat_sink", "fin_height", -0.01, "Expected `float` > 0.0 - at `$.heat_sink.fin_height`"),
+        ("heat_sink", "thermal_conductivity", 0, "Expected `float` > 0.0 - at `$.heat_sink.thermal_conductivity`"),
+        ("air", "velocity", "1.0", "Expected `float`, got `str` - at `$.air.velocity`"),
+        ("tim", "thickness", True, "Expected `float`, got `bool` - at `$.tim.thickness`"),
+        (None, "junction_to_case_resistance", -1, "Expected `float` > 0.0 - at `$.junction_to_case_resistance`")
+    ]
+)
+def test_validate_reports_invalid_field(reference_payload, section, field, value, message):
+    """
+    Dict payloads are checked against the same constraints as decoding.
+    """
+
+    target = reference_payload if section is None else reference_payload[section]
+    target[field] = value
+
+    with pytest.raises(ValueError, match=re.escape(message)):
+        ThermalRequestSchema.validate(reference_payload)
+
+
+@pytest.mark.parametrize("temperature", [0, 0.0, -40.0])
+def test_validate_allows_zero_and_negative_ambient(reference_payload, temperature):
+    reference_payload["ambient"]["temperature"] = temperature
+
+    request = ThermalRequestSchema.validate(reference_payload)
+
+    assert request.ambient.temperature == temperature
+
+
+@pytest.mark.parametrize(
+    "section, field",
+    [("processor", "die_width"), ("air", "prandtl_number"), (None, "ambient")]
+)
+def test_validate_rejects_missing_field(reference_payload, section, field):
+    target = reference_payload if section is None else reference_payload[section]
+    del target[field]
+
+    with pytest.raises(ValueError, match=f"missing required field `{field}`"):
+        ThermalRequestSchema.validate(reference_payload)
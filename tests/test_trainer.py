@@ -0,0 +1,76 @@
+"""
+Smoke tests for the PINN training loop.
+"""
+
+import pytest
+import torch
+
+from pinn.domain import HeatSinkDomain
+from pinn.model import ThermalPINN
+from pinn.trainer import PINNTrainer
+
+
+@pytest.fixture
+def trainer():
+    torch.manual_seed(0)
+    domain = HeatSinkDomain(
+        sink_length=0.09,
+        sink_width=0.116,
+        fin_height=0.0245,
+        base_thickness=0.0025,
+        seed=0
+    )
+    return PINNTrainer(
+        ThermalPINN(hidden_dim=16, num_hidden_layers=2),
+        domain,
+        thermal_conductivity=167.0,
+        heat_flux=1e4,
+        heat_transfer_coefficient=50.0,
+        ambient_temperature=25.0,
+        expected_base_temperature=60.0
+    )
+
+
+def test_train_updates_parameters(trainer, capsys):
+    before = [p.detach().clone() for p in trainer.model.parameters()]
+
+    trainer.train(epochs=2, n_interior=32, n_base=16, n_surface=16)
+
+    after = list(trainer.model.parameters())
+    assert any(not torch.equal(b, a) for b, a in zip(before, after))
+    assert "[Epoch     1]" in capsys.readouterr().out
+
+
+def test_mixed_precision_losses_are_fp32(trainer):
+    """
+    BF16 autocast still yields finite FP32 losses and FP32 parameters.
+    """
+
+    points = trainer._sample_points(32, 16, 16)
+    optimizer = torch.optim.Adam(trainer.model.parameters())
+
+    losses = trainer._training_step(optimizer, {
+        "pde": 1.0, "base": 1.0, "conv": 1.0, "lumped": 0.5
+    }, True, *points)
+
+    assert all(loss.dtype == torch.float32 for loss in losses)
+    assert all(torch.isfinite(loss) for loss in losses)
+    assert all(p.dtype == torch.float32 for p in trainer.model.parameters())
+
+
+def test_float64_model_keeps_float64_losses(trainer):
+    """
+    Losses of a double-precision model are not downcast to FP32.
+    """
+
+    trainer.model.double()
+    points = [p.double() for p in trainer._sample_points(32, 16, 16)]
+
+    losses = trainer._compute_losses(*points)
+
+    assert all(loss.dtype == torch.float64 for loss in losses)
+
+
+def test_cuda_graph_requires_cuda_device(trainer):
+    with pytest.raises(ValueError):
+        trainer.train(epochs=1, cuda_graph=True)